@@ -0,0 +1,322 @@
+"""
+Framework self-overhead benchmarks.
+
+Measures what TestPack itself adds to a reported latency by running each
+framework layer against a no-op engine:
+
+- clock reads (`perf_counter_ns`)
+- the per-iteration loop of each latency strategy (incl. result building),
+  with `LatencyStrategy` order generation reported separately as setup
+- `TestExecutor` dispatch, with and without plugins (per-plugin hook cost)
+- the `rich` status printing done by `PerformanceSuite`
+
+Results are compared against tracked baselines in `baselines/`, so changes
+that add nanoseconds to the hot path are caught.
+
+Usage (from `src/`):
+    python -m benchmarks.framework_overhead            # check against baseline
+    python -m benchmarks.framework_overhead --update-baseline
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from rich import print as rprint
+from core.interfaces import IEngine, ITestStrategy
+from core.result_cache import environment_fingerprint
+from core.test_executor import TestExecutor
+from engines.simple_engine_driver import SimpleEngineDriver
+from test_strategies.latency_strategy import LatencyStrategy
+from test_types.latency_test import LatencyTest
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baselines" / "framework_overhead.json"
+
+# A metric regresses when it exceeds baseline * tolerance + slack. Hot path
+# metrics (paid on every measured operation) get a tight limit; dispatch and
+# printing are coarser and noisier.
+DEFAULT_TOLERANCE = 1.5
+ABSOLUTE_SLACK_NS = 20.0
+HOT_PATH_TOLERANCE = 1.15
+HOT_PATH_SLACK_NS = 25.0
+HOT_PATH_METRICS = (
+    "clock_read_ns",
+    "latency_test_iteration_ns",
+    "latency_strategy_iteration_ns",
+    "plugin_hook_ns",
+)
+
+# Full re-measurements before a regression is reported
+CONFIRM_ATTEMPTS = 3
+# Full runs a baseline is taken from (median per metric)
+BASELINE_RUNS = 5
+
+# Set to run the benchmark from pytest (tests/test_framework_overhead.py), e.g. in CI
+RUN_BENCHMARKS_ENV = "TESTPACK_RUN_BENCHMARKS"
+
+PLUGIN_COUNT = 32
+
+
+class NoOpEngine(IEngine):
+    """Engine whose trades cost nothing, isolating the framework overhead."""
+
+    @property
+    def name(self) -> str:
+        return "NoOpEngine"
+
+    def execute_trade(self, order: Dict[str, Any]) -> Any:
+        return None
+
+
+class NoOpDriver(SimpleEngineDriver):
+    """Driver variant of `NoOpEngine` for driver-based strategies."""
+
+    def __init__(self):
+        super().__init__(name="driver_NoOpEngine", engine_name="NoOpEngine")
+
+    def execute_trade(self, symbol: str, volume: int, *args, **kwargs) -> int:
+        return 0
+
+
+class NoOpStrategy(ITestStrategy):
+    """Strategy that returns immediately, isolating `TestExecutor` dispatch."""
+
+    @property
+    def test_type(self) -> str:
+        return "noop"
+
+    def execute_test(self, engine: IEngine, iterations: int = 1000) -> Dict[str, Any]:
+        return {}
+
+    def analyze_results(self, result_data, testplan_result):
+        pass
+
+
+class NoOpPlugin:
+    """Plugin implementing the lifecycle hooks without doing any work."""
+    name = "noop"
+
+    def on_test_start(self, engine_name: str, test_type: str) -> None:
+        pass
+
+    def on_test_progress(self, engine_name: str, test_type: str, latencies_ns) -> None:
+        pass
+
+    def on_test_complete(self, results: Dict[str, Any]) -> None:
+        pass
+
+
+def _per_op_ns(func: Callable[[], Any], ops_per_call: int, repeats: int) -> float:
+    """
+    Best (minimum) cost in ns of one operation over `repeats` timed calls.
+    The garbage collector is paused while timing (like `timeit`), so its
+    pauses, which grow with the size of the host process heap, are not counted.
+    """
+    samples = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeats):
+            start = time.perf_counter_ns()
+            func()
+            samples.append((time.perf_counter_ns() - start) / ops_per_call)
+    finally:
+        gc.enable()
+    return min(samples)
+
+
+@contextlib.contextmanager
+def _silenced():
+    """Sends the framework's console output to /dev/null while timing."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def bench_clock_read(n: int = 100_000, repeats: int = 31) -> float:
+    clock = time.perf_counter_ns
+
+    def reads():
+        for _ in range(n):
+            clock()
+
+    def empty():
+        for _ in range(n):
+            pass
+
+    # Subtract the bare loop so only the read itself is reported
+    return max(_per_op_ns(reads, n, repeats) - _per_op_ns(empty, n, repeats), 0.0)
+
+
+def bench_strategy_loop(strategy: ITestStrategy, engine: Any, n: int = 20_000, repeats: int = 31) -> float:
+    return _per_op_ns(lambda: strategy.execute_test(engine, iterations=n), n, repeats)
+
+
+def bench_strategy_setup(strategy: LatencyStrategy, n: int = 20_000, repeats: int = 31) -> float:
+    """Per-iteration cost of the order generation done before the measurement loop."""
+    return _per_op_ns(lambda: strategy.generate_orders(n), n, repeats)
+
+
+def bench_measurement_loop(strategy: LatencyStrategy, engine: Any, n: int = 20_000, repeats: int = 31) -> float:
+    """Per-iteration cost of the `LatencyStrategy` measurement loop alone."""
+    _, orders = strategy.generate_orders(n)
+    samples, timestamps = array("q", bytes(8 * n)), array("q", bytes(8 * n))
+    return _per_op_ns(lambda: strategy.run_orders(engine, orders, samples, timestamps), n, repeats)
+
+
+def bench_executor_dispatch(plugin_count: int, n: int = 2_000, repeats: int = 31) -> float:
+    executor = TestExecutor(NoOpStrategy(), plugins=[NoOpPlugin() for _ in range(plugin_count)])
+    engine = NoOpEngine()
+
+    def dispatch():
+        for _ in range(n):
+            executor.execute_test(engine, iterations=1)
+
+    with _silenced():
+        return _per_op_ns(dispatch, n, repeats)
+
+
+def bench_rich_print(n: int = 500, repeats: int = 9) -> float:
+    def prints():
+        for _ in range(n):
+            rprint("[blue]Got raw results for NoOpEngine_latency_performance_test[/blue]")
+
+    with _silenced():
+        return _per_op_ns(prints, n, repeats)
+
+
+def run_benchmarks() -> Dict[str, float]:
+    """
+    Runs every framework benchmark.
+
+    Returns:
+        Dict[str, float]: Metric name -> cost in nanoseconds
+    """
+    with _silenced():
+        driver = NoOpDriver()
+
+    dispatch_no_plugins = bench_executor_dispatch(0)
+    dispatch_with_plugins = bench_executor_dispatch(PLUGIN_COUNT)
+    latency_strategy = LatencyStrategy()
+
+    return {
+        "clock_read_ns": bench_clock_read(),
+        "latency_test_iteration_ns": bench_strategy_loop(LatencyTest(), NoOpEngine()),
+        # Measurement loop only; order generation happens before it
+        "latency_strategy_iteration_ns": bench_measurement_loop(latency_strategy, driver),
+        "latency_strategy_setup_ns": bench_strategy_setup(latency_strategy),
+        "executor_dispatch_ns": dispatch_no_plugins,
+        # Each plugin receives two hooks (start + complete) per test
+        "plugin_hook_ns": max(dispatch_with_plugins - dispatch_no_plugins, 0.0) / (2 * PLUGIN_COUNT),
+        "rich_print_ns": bench_rich_print(),
+    }
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(metrics: Dict[str, float], path: Path = BASELINE_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {"environment": environment_fingerprint(), "metrics": metrics},
+            f, indent=2, sort_keys=True
+        )
+        f.write("\n")
+
+
+def find_regressions(
+    metrics: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float = DEFAULT_TOLERANCE,
+    hot_path_tolerance: float = HOT_PATH_TOLERANCE
+) -> List[str]:
+    """
+    Compares `metrics` with the `baseline` metrics, using the tight
+    `hot_path_tolerance` (+ HOT_PATH_SLACK_NS) for HOT_PATH_METRICS and
+    `tolerance` (+ ABSOLUTE_SLACK_NS) for everything else.
+
+    Returns:
+        List[str]: One human readable line per regressed metric
+    """
+    regressions = []
+    for metric, value in metrics.items():
+        reference = baseline.get(metric)
+        if reference is None:
+            continue
+        if metric in HOT_PATH_METRICS:
+            limit = reference * hot_path_tolerance + HOT_PATH_SLACK_NS
+        else:
+            limit = reference * tolerance + ABSOLUTE_SLACK_NS
+        if value > limit:
+            regressions.append(f"{metric}: {value:.1f} ns (baseline {reference:.1f} ns, limit {limit:.1f} ns)")
+    return regressions
+
+
+def check_regressions(
+    baseline: Dict[str, float],
+    tolerance: float = DEFAULT_TOLERANCE,
+    hot_path_tolerance: float = HOT_PATH_TOLERANCE,
+    attempts: int = CONFIRM_ATTEMPTS
+) -> Tuple[Dict[str, float], List[str]]:
+    """
+    Runs the benchmarks and re-measures (up to `attempts` runs in total)
+    while any metric regresses, keeping the best value of each metric, so
+    a burst of machine noise is not reported as a regression.
+
+    Returns:
+        Tuple[Dict[str, float], List[str]]: Best metrics and the remaining regressions
+    """
+    metrics = run_benchmarks()
+    regressions = find_regressions(metrics, baseline, tolerance, hot_path_tolerance)
+    for _ in range(attempts - 1):
+        if not regressions:
+            break
+        rerun = run_benchmarks()
+        metrics = {metric: min(value, rerun[metric]) for metric, value in metrics.items()}
+        regressions = find_regressions(metrics, baseline, tolerance, hot_path_tolerance)
+    return metrics, regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the tracked baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--hot-path-tolerance", type=float, default=HOT_PATH_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    if args.update_baseline:
+        # Median over several runs: a single quiet run would make the limits unreachable
+        runs = [run_benchmarks() for _ in range(BASELINE_RUNS)]
+        metrics = {metric: statistics.median(run[metric] for run in runs) for metric in runs[0]}
+        for metric, value in metrics.items():
+            print(f"{metric:32s} {value:12.1f}")
+        save_baseline(metrics)
+        print(f"Baseline written to {BASELINE_FILE}")
+        return 0
+
+    baseline = load_baseline()
+    if baseline.get("environment") != environment_fingerprint():
+        print("Warning: baseline was recorded on a different machine/interpreter")
+
+    metrics, regressions = check_regressions(baseline["metrics"], args.tolerance, args.hot_path_tolerance)
+    for metric, value in metrics.items():
+        print(f"{metric:32s} {value:12.1f}")
+    if regressions:
+        print("Framework overhead regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No framework overhead regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
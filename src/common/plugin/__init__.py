@@ -1,6 +1,6 @@
 from enum import Enum, auto
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 from testplan.common.config import Config
 
 class RuntimeType(Enum):
@@ -34,7 +34,11 @@ class TestplanPlugin(ABC):
         """Called when a test starts."""
         pass
 
-    def on_test_complete(self, results: Dict[str, Any]) -> None:
+    def on_test_progress(self, engine_name: str, test_type: str, latencies_ns: Sequence[int]) -> None:
+        """Called periodically during a test with the latencies measured since the last call."""
+        pass
+
+    def on_test_complete(self, results: Any) -> None:
         """Called when a test completes."""
         pass
 
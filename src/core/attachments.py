@@ -0,0 +1,122 @@
+import atexit
+import os
+import shutil
+import tempfile
+from typing import Any, Optional
+from testplan.testing.result import Result
+from core.results import RECORD_SUFFIX, LatencySummary, dumps, loads
+from core.shared_buffers import open_samples
+
+# Directory to keep attachment files in; by default they go to a per-run
+# temporary directory that is removed when the process exits
+ATTACHMENTS_DIR_ENV = "TESTPACK_ATTACHMENTS_DIR"
+
+_RUN_DIR: Optional[str] = None
+
+
+def attachments_dir() -> str:
+    """Directory attachment files are written to before Testplan picks them up."""
+    global _RUN_DIR
+    if _RUN_DIR is None:
+        kept_dir = os.environ.get(ATTACHMENTS_DIR_ENV)
+        if kept_dir:
+            os.makedirs(kept_dir, exist_ok=True)
+            _RUN_DIR = kept_dir
+        else:
+            _RUN_DIR = tempfile.mkdtemp(prefix="testpack_attachments_")
+            atexit.register(shutil.rmtree, _RUN_DIR, ignore_errors=True)
+    return _RUN_DIR
+
+
+def attachment_file(prefix: str, suffix: str) -> str:
+    """
+    Creates an empty, uniquely named file in `attachments_dir()`.
+
+    Returns:
+        str: Path of the file
+    """
+    fd, path = tempfile.mkstemp(prefix=f"{prefix}_", suffix=suffix, dir=attachments_dir())
+    os.close(fd)
+    return path
+
+
+def attach_file(result: Result, path: str, description: str) -> str:
+    """
+    Attaches a file written by us to the testcase report. When Testplan
+    copied it into the testcase scratch directory, our file is removed.
+
+    Returns:
+        str: Path of the attached file (the scratch copy if one was made)
+    """
+    attachment = result.attach(path, description=description)
+    if attachment.source_path != path:
+        os.remove(path)
+    return attachment.source_path
+
+
+def attach_record(result: Result, key: str, record: Any) -> str:
+    """
+    Stores `record` (a result record or plain data) in the binary record
+    format and attaches it to the testcase report under the description
+    `key`, where plugins can retrieve it with `get_attachment_data`.
+
+    Returns:
+        str: Path of the attached file
+    """
+    path = attachment_file(key, RECORD_SUFFIX)
+    with open(path, "wb") as f:
+        f.write(dumps(record))
+    return attach_file(result, path, key)
+
+
+def get_attachment_data(case: Any, key: str) -> Optional[Any]:
+    """
+    Returns the data attached under `key` to a testcase report, or None.
+
+    Supports both Testplan attachment lists (as produced by `attach_record`)
+    and plain dicts keyed by name.
+    """
+    attachments = getattr(case, "attachments", None) or []
+    if isinstance(attachments, dict):
+        return attachments.get(key)
+    for attachment in attachments:
+        if getattr(attachment, "description", None) == key:
+            with open(attachment.source_path, "rb") as f:
+                return loads(f.read())
+    return None
+
+
+def summarize_latencies(raw_data: Any) -> Optional[LatencySummary]:
+    """
+    Summary of a 'LatencyRawData' attachment, which is a `LatencySummary`
+    record or a dict holding a `latency_data_ms` list or a `latency_data_ns`
+    shared buffer handle. Shared buffers are summarized on a zero-copy view.
+
+    Returns:
+        Optional[LatencySummary]: None when the attachment has no samples
+    """
+    if isinstance(raw_data, LatencySummary):
+        return raw_data
+    if raw_data.get("latency_data_ms"):
+        latencies, scale = raw_data["latency_data_ms"], 1.0
+    elif raw_data.get("latency_data_ns"):
+        latencies, scale = raw_data["latency_data_ns"], 1 / 1_000_000
+    else:
+        return None
+
+    with open_samples(latencies) as samples:
+        count = len(samples)
+        if not count:
+            return None
+        if hasattr(samples, "min"):
+            # NumPy view: vectorized reductions
+            low, high, total = samples.min(), samples.max(), samples.sum()
+        else:
+            low, high, total = min(samples), max(samples), sum(samples)
+        del samples
+    return LatencySummary(
+        data_points=count,
+        min_ms=float(low) * scale,
+        max_ms=float(high) * scale,
+        avg_ms=float(total) / count * scale,
+    )
@@ -1,6 +1,8 @@
 from core.interfaces import IEngine, ITestStrategy
 from test_strategies.latency_strategy import LatencyStrategy
 from test_strategies.stress_strategy import StressStrategy
+from test_strategies.comparison_strategy import ComparisonStrategy
+from test_strategies.soak_strategy import SoakStrategy
 from engines.simple_engine_driver import SimpleEngineDriver
 from plugins.metric_reporter import MetricReporterPlugin
 from typing import Type, Dict, List, Any
@@ -13,7 +15,9 @@ class FactoryRegistry:
         self._drivers: Dict[str, Type[SimpleEngineDriver]] = {}
         self._strategies: Dict[str, Type[ITestStrategy]] = {
             "latency": LatencyStrategy,
-            "stress": StressStrategy
+            "stress": StressStrategy,
+            "comparison": ComparisonStrategy,
+            "soak": SoakStrategy
         }
 
     def register_engine(self, engine_class: Type[IEngine]):
@@ -0,0 +1,115 @@
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Values below LINEAR_LIMIT get one bucket each; above it every power of two
+# is split into SUB_BUCKETS buckets, bounding the relative error to 1/SUB_BUCKETS.
+SUB_BUCKET_BITS = 6
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+LINEAR_LIMIT = 2 * SUB_BUCKETS
+
+
+def bucket_index(value: int) -> int:
+    """Histogram bucket of a non-negative integer value."""
+    if value < LINEAR_LIMIT:
+        return max(value, 0)
+    exponent = value.bit_length() - 1
+    shift = exponent - SUB_BUCKET_BITS
+    return LINEAR_LIMIT + (shift - 1) * SUB_BUCKETS + ((value >> shift) - SUB_BUCKETS)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """Inclusive lower and exclusive upper value of bucket `index`."""
+    if index < LINEAR_LIMIT:
+        return index, index + 1
+    shift = (index - LINEAR_LIMIT) // SUB_BUCKETS + 1
+    sub = (index - LINEAR_LIMIT) % SUB_BUCKETS + SUB_BUCKETS
+    return sub << shift, (sub + 1) << shift
+
+
+class LatencyHistogram:
+    """
+    Fixed-precision log-linear histogram of integer latencies (ns).
+
+    Memory depends on the value range only, never on the number of
+    recorded samples, and histograms merge exactly, which makes them
+    suitable for rolling segments and incremental rollups.
+    """
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def record(self, value: int) -> None:
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def record_many(self, values: Iterable[int]) -> None:
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        if other.max is not None and (self.max is None or other.max > self.max):
+            self.max = other.max
+
+    def percentile(self, p: float) -> Optional[float]:
+        """Value at percentile `p` (0-100), reported as its bucket midpoint."""
+        if not self.count:
+            return None
+        rank = max(1, round(p / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                low, high = bucket_bounds(index)
+                # Clamp to the exact extremes seen
+                return min(max((low + high - 1) / 2, self.min), self.max)
+        return float(self.max)
+
+    def summary(self, scale: float = 1 / 1_000_000) -> Dict[str, Any]:
+        """Count, mean, percentiles and extremes, converted with `scale` (default ns -> ms)."""
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "avg": self.total / self.count * scale,
+            "min": self.min * scale,
+            "p50": self.percentile(50) * scale,
+            "p90": self.percentile(90) * scale,
+            "p99": self.percentile(99) * scale,
+            "p999": self.percentile(99.9) * scale,
+            "max": self.max * scale,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counts": {str(index): n for index, n in self.counts.items()},
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(index): n for index, n in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
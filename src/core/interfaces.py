@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 from testplan.common.entity import Resource
 from testplan.testing.result import Result
 from rich import print as rprint
+from core.results import ResultRecord
 
 # --- Single Responsibility: Engine Definition ---
 class IEngine(ABC):
@@ -28,6 +29,10 @@ class ITestStrategy(ABC):
     Adheres to Strategy Pattern and Liskov Substitution Principle.
     """
 
+    # Whether results may be reused from the result cache (see core.result_cache);
+    # strategies whose results depend on state outside the cache key opt out
+    cacheable: bool = True
+
     @property
     @abstractmethod
     def test_type(self) -> str:
@@ -35,18 +40,18 @@ class ITestStrategy(ABC):
         pass
 
     @abstractmethod
-    def execute_test(self, engine: IEngine, iterations: int = 1000) -> Dict[str, Any]:
-    # def execute_test(self, engine: Resource, iterations: int = 1000) -> Dict[str, Any]:
+    def execute_test(self, engine: IEngine, iterations: int = 1000) -> ResultRecord:
+    # def execute_test(self, engine: Resource, iterations: int = 1000) -> ResultRecord:
         """
         Runs the specific test type against the given engine.
         Runs the specific test type algorithm against the engine driver.
-        Returns raw metrics.
+        Returns raw metrics as a typed result record (see core.results).
         """
         rprint(f"Executing test with {iterations} iterations")
         pass
     
     @abstractmethod
-    def analyze_results(self, result_data: Dict[str, Any], testplan_result: Result):
+    def analyze_results(self, result_data: ResultRecord, testplan_result: Result):
         """
         Analyzes raw metrics and uses Testplan's result object for reporting/assertions.
         """
@@ -70,7 +75,11 @@ class IPlugin(ABC):
         """Called before a test starts."""
         pass
 
+    def on_test_progress(self, engine_name: str, test_type: str, latencies_ns: Sequence[int]):
+        """Called periodically during a test with the latencies measured since the last call."""
+        pass
+
     @abstractmethod
-    def on_test_complete(self, results: Dict[str, Any]):
+    def on_test_complete(self, results: ResultRecord):
         """Called after a test completes with results."""
         pass
@@ -0,0 +1,167 @@
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple
+from testplan.testing.result import Result
+from core.attachments import attach_file, attachment_file
+
+# Opt-in switch for profiling every performance testcase
+PROFILE_ENV = "TESTPACK_PROFILE"
+
+# mode -> (timer, signal): "wall" samples elapsed time (incl. sleeps/IO), "cpu" only CPU time
+_TIMERS = {
+    "wall": (signal.ITIMER_REAL, signal.SIGALRM),
+    "cpu": (signal.ITIMER_PROF, signal.SIGPROF),
+}
+
+
+# Profiler currently sampling (the interval timers are process-wide, so one at a time)
+_ACTIVE: Optional["SamplingProfiler"] = None
+# Guards the check-and-set of _ACTIVE (testcases enter profilers from worker threads)
+_ACTIVE_LOCK = threading.Lock()
+_HANDLERS_INSTALLED = False
+
+
+def profiling_requested() -> bool:
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _dispatch(signum, frame) -> None:
+    profiler = _ACTIVE
+    if profiler is not None:
+        profiler._handler(signum, frame)
+
+
+def install_signal_handlers() -> None:
+    """
+    Installs the timer signal handlers used by `SamplingProfiler`. Must run
+    on the main thread (e.g. at plan start) before profiling on other
+    threads; the main thread then samples whichever thread is profiled.
+    """
+    global _HANDLERS_INSTALLED
+    if _HANDLERS_INSTALLED:
+        return
+    for _, signum in _TIMERS.values():
+        signal.signal(signum, _dispatch)
+    _HANDLERS_INSTALLED = True
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class SamplingProfiler:
+    """
+    Low-overhead statistical profiler driven by a timer signal.
+
+    Every `interval_s` the stack of the thread that entered the profiler is
+    recorded; stacks are collapsed into the folded format ("root;child;leaf
+    count") understood by flame graph tools. The time spent inside the
+    signal handler is accumulated so the profiler's own overhead can be
+    reported next to the results.
+
+    Signal handlers run on the main thread, which samples the profiled
+    thread through `sys._current_frames()`. Entering on another thread
+    requires `install_signal_handlers` to have been called from the main
+    thread first; otherwise (or while another profiler is sampling) the
+    profiler disables itself and records why.
+    """
+
+    def __init__(self, interval_s: float = 0.001, mode: str = "wall", max_depth: int = 128):
+        if mode not in _TIMERS:
+            raise ValueError(f"Unknown profiler mode: {mode}")
+        self.interval_s = interval_s
+        self.mode = mode
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.overhead_ns = 0
+        self.wall_ns = 0
+        self.disabled_reason: Optional[str] = None
+        self._target_ident: Optional[int] = None
+        self._start_ns = 0
+
+    def _handler(self, signum, frame) -> None:
+        start = time.perf_counter_ns()
+        if self._target_ident != threading.main_thread().ident:
+            frame = sys._current_frames().get(self._target_ident)
+            if frame is None:
+                return  # Profiled thread already exited
+        stack = []
+        while frame is not None and len(stack) < self.max_depth:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+        self.samples += 1
+        self.overhead_ns += time.perf_counter_ns() - start
+
+    def __enter__(self) -> "SamplingProfiler":
+        global _ACTIVE
+        if threading.current_thread() is threading.main_thread():
+            install_signal_handlers()
+        elif not _HANDLERS_INSTALLED:
+            self.disabled_reason = "install_signal_handlers() was not called from the main thread"
+            return self
+        with _ACTIVE_LOCK:
+            if _ACTIVE is not None:
+                self.disabled_reason = "another profiler is already sampling"
+                return self
+            self._target_ident = threading.get_ident()
+            _ACTIVE = self
+        self._start_ns = time.perf_counter_ns()
+        signal.setitimer(_TIMERS[self.mode][0], self.interval_s, self.interval_s)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _ACTIVE
+        if self.disabled_reason:
+            return
+        signal.setitimer(_TIMERS[self.mode][0], 0, 0)
+        self.wall_ns = time.perf_counter_ns() - self._start_ns
+        with _ACTIVE_LOCK:
+            _ACTIVE = None
+
+    def folded(self) -> str:
+        """Collapsed stacks, one "frame;frame;frame count" line per unique stack."""
+        return "".join(
+            f"{';'.join(stack)} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "interval_ms": self.interval_s * 1000,
+            "samples": self.samples,
+            "unique_stacks": len(self.stacks),
+            "wall_ms": self.wall_ns / 1_000_000,
+            "overhead_ms": self.overhead_ns / 1_000_000,
+            "overhead_pct": 100 * self.overhead_ns / self.wall_ns if self.wall_ns else 0.0,
+            "disabled_reason": self.disabled_reason,
+        }
+
+    def top_frames(self, limit: int = 10) -> Tuple[Tuple[str, int], ...]:
+        """Leaf frames with the most samples (where the time was actually spent)."""
+        leaves: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack[-1]] += count
+        return tuple(leaves.most_common(limit))
+
+    def attach_to(self, result: Result, name: str) -> None:
+        """Attaches the folded stacks and logs the profile summary to the testcase report."""
+        summary = self.summary()
+        result.dict.log(summary, description=f"Sampling profile: {name}")
+        if not self.samples:
+            return
+        result.table.log(
+            [["frame", "samples"]] + [list(row) for row in self.top_frames()],
+            description=f"Top frames: {name}"
+        )
+        path = attachment_file(name, ".folded")
+        with open(path, "w") as f:
+            f.write(self.folded())
+        attach_file(result, path, f"{name} profile (folded stacks)")
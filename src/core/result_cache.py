@@ -0,0 +1,238 @@
+import ast
+import hashlib
+import inspect
+import json
+import os
+import platform
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from core.results import RECORD_SUFFIX, ResultRecord, dumps, loads
+from core.shared_buffers import contains_shared_handles
+
+# Environment switches for CI jobs
+CACHE_DIR_ENV = "TESTPACK_CACHE_DIR"
+CACHE_BYPASS_ENV = "TESTPACK_CACHE_BYPASS"
+
+DEFAULT_CACHE_DIR = ".testpack_cache/results"
+# Third-party packages whose code runs in (or around) the measurements
+FINGERPRINT_PACKAGES = ("testplan", "polars", "rich", "numpy")
+# Suffix of entries written before the binary record format
+LEGACY_SUFFIX = ".json"
+
+
+def _cpu_model() -> str:
+    """Best effort CPU model string (falls back to the platform processor)."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _package_version(name: str) -> Optional[str]:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def environment_fingerprint() -> Dict[str, Any]:
+    """Describes the machine/interpreter (and third-party package versions) that produced a set of results."""
+    return {
+        "cpu_model": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "machine": platform.machine(),
+        "python": f"{platform.python_implementation()} {platform.python_version()}",
+        "packages": {name: _package_version(name) for name in FINGERPRINT_PACKAGES},
+    }
+
+
+SRC_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _class_sources(cls: type) -> List[str]:
+    """
+    Returns the source files of every project class in the MRO of `cls`.
+    Third-party bases (e.g. the Testplan Driver) are pinned by the package
+    versions in the environment fingerprint instead, so only our own
+    modules are hashed.
+    """
+    sources = []
+    for klass in cls.__mro__:
+        try:
+            source_file = Path(inspect.getsourcefile(klass)).resolve()
+        except (TypeError, OSError):
+            continue
+        if SRC_ROOT in source_file.parents and str(source_file) not in sources:
+            sources.append(str(source_file))
+    return sources
+
+
+def _module_file(module: str) -> Optional[Path]:
+    """Source file of project module `module` (dotted name), if it lives under src/."""
+    base = SRC_ROOT.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_project_modules(source_file: Path) -> List[Path]:
+    """Project modules imported by `source_file` (absolute imports, as used throughout src/)."""
+    tree = ast.parse(source_file.read_bytes(), filename=str(source_file))
+    modules: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.append(node.module)
+            # `from package import module` imports a module, not an attribute
+            modules.extend(f"{node.module}.{alias.name}" for alias in node.names)
+    return [path for path in map(_module_file, modules) if path is not None]
+
+
+def _dependency_sources(cls: type) -> List[str]:
+    """
+    Source files of the project classes in the MRO of `cls` plus every
+    project module they import, transitively (e.g. core.timing or the
+    memory workload behind a strategy), so a change to any of them
+    invalidates cached results.
+    """
+    sources = [Path(source) for source in _class_sources(cls)]
+    seen = set(sources)
+    pending = list(sources)
+    while pending:
+        for dependency in _imported_project_modules(pending.pop()):
+            dependency = dependency.resolve()
+            if dependency not in seen:
+                seen.add(dependency)
+                sources.append(dependency)
+                pending.append(dependency)
+    return sorted(str(source) for source in sources)
+
+
+class ResultCache:
+    """
+    Content-addressed store for raw strategy results.
+
+    Entries are result records in the binary record format (see
+    core.results), so sample columns are stored as raw bytes.
+
+    Entries are keyed on a hash of the engine/driver and strategy module
+    sources (including the project modules they import), the strategy parameters and the environment fingerprint, so an
+    entry is only reused when nothing that could affect the measurement
+    has changed. Eviction is LRU (by file mtime, refreshed on every hit)
+    bounded by both entry count and total size on disk.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_entries: int = 64,
+        max_bytes: int = 256 * 1024 * 1024,
+        bypass: Optional[bool] = None,
+    ):
+        self.cache_dir = Path(cache_dir or os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        if bypass is None:
+            bypass = os.environ.get(CACHE_BYPASS_ENV, "").lower() in ("1", "true", "yes")
+        self.bypass = bypass
+
+    def make_key(self, engine: Any, strategy: Any, **params: Any) -> str:
+        """
+        Builds the cache key for running `strategy` against `engine`.
+
+        Args:
+            engine: Engine or driver instance under test
+            strategy: Strategy instance that will be executed
+            **params: Extra run parameters (iterations, warmup size, ...)
+
+        Returns:
+            str: Hex digest identifying the engine/test combination
+        """
+        digest = hashlib.sha256()
+        for source_file in _dependency_sources(type(engine)) + _dependency_sources(type(strategy)):
+            # Relative path, so the same tree checked out elsewhere (e.g. another CI workspace) hits
+            digest.update(Path(source_file).relative_to(SRC_ROOT).as_posix().encode())
+            digest.update(Path(source_file).read_bytes())
+
+        key_inputs = {
+            "engine": getattr(engine, "name", type(engine).__name__),
+            "strategy": f"{type(strategy).__module__}.{type(strategy).__qualname__}",
+            "strategy_params": vars(strategy),
+            "params": params,
+            "environment": environment_fingerprint(),
+        }
+        digest.update(json.dumps(key_inputs, sort_keys=True, default=repr).encode())
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{RECORD_SUFFIX}"
+
+    def get(self, key: str) -> Optional[ResultRecord]:
+        """Returns the cached results for `key`, or None on a miss/bypass."""
+        if self.bypass:
+            return None
+        path = self._entry_path(key)
+        try:
+            results = loads(path.read_bytes())
+        except (OSError, ValueError):
+            # Missing, truncated or written by another version (e.g. unknown record type)
+            return None
+        # Refresh the mtime so eviction treats this entry as recently used
+        os.utime(path)
+        return results
+
+    def put(self, key: str, results: ResultRecord) -> None:
+        """Stores `results` under `key` and evicts old entries if needed."""
+        if contains_shared_handles(results):
+            # Shared memory segments do not outlive the run
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(dumps(results))
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> List[str]:
+        """
+        Removes least recently used entries until both the entry count and
+        the total size are within limits.
+
+        Returns:
+            List[str]: Keys that were evicted
+        """
+        if not self.cache_dir.is_dir():
+            return []
+        evicted = []
+        for path in self._legacy_entries():
+            # Never read again since entries moved to the record format
+            path.unlink(missing_ok=True)
+            evicted.append(path.stem)
+        stats = [(p, p.stat()) for p in self.cache_dir.glob(f"*{RECORD_SUFFIX}")]
+        entries = sorted((st.st_mtime_ns, st.st_size, p) for p, st in stats)
+        total_bytes = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+            evicted.append(path.stem)
+        return evicted
+
+    def _legacy_entries(self) -> List[Path]:
+        return list(self.cache_dir.glob(f"*{LEGACY_SUFFIX}"))
+
+    def clear(self) -> None:
+        """Drops every cached entry (including entries in the old JSON format)."""
+        if self.cache_dir.is_dir():
+            for path in list(self.cache_dir.glob(f"*{RECORD_SUFFIX}")) + self._legacy_entries():
+                path.unlink(missing_ok=True)
+
+# Global Cache Instance
+RESULT_CACHE = ResultCache()
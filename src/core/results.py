@@ -0,0 +1,207 @@
+"""
+Typed result records.
+
+Every strategy returns one of the slotted dataclasses below instead of a
+loose dict, and the executor, the Testplan attachments and the reporter
+plugins read them by attribute. Sample columns are `array.array`s (8 bytes
+per sample instead of a boxed int in a list) or, with `shared_memory=True`,
+shared buffer handles.
+
+`dumps`/`loads` give a cheap binary serialization: a small JSON header for
+the scalar fields followed by the raw bytes of every array column, so
+encoding and decoding a column is a single memory copy.
+"""
+import json
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, ClassVar, Dict, List, Union
+from core.sample_tags import SampleTags
+from core.timing import ClockCalibration
+
+# Sample column: an array of samples or a shared buffer handle (see core.shared_buffers)
+Samples = Union[array, Dict[str, Any]]
+
+RECORD_MAGIC = b"TPR1"
+RECORD_SUFFIX = ".tpr"
+_HEADER = struct.Struct("<4sI")  # Magic, header length
+
+
+class ResultRecord:
+    """Base class of all result records."""
+    __slots__ = ()
+    test_type: ClassVar[str] = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the record fields, e.g. for `result.dict.log`."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class LatencySummary(ResultRecord):
+    """Count and min/max/avg (ms) of a set of latency samples."""
+    data_points: int
+    min_ms: float
+    max_ms: float
+    avg_ms: float
+
+
+@dataclass(slots=True)
+class LatencyResult(ResultRecord):
+    """Per-order latencies of `LatencyStrategy`, tagged by order dimension."""
+    test_type: ClassVar[str] = "latency"
+    engine_name: str
+    latencies_ns: Samples = field(repr=False)
+    timestamps_ns: Samples = field(repr=False)  # Send time of every order
+    sample_tags: SampleTags = field(repr=False)
+    clock_calibration: ClockCalibration
+    timer_overhead_subtracted: bool = False
+
+
+@dataclass(slots=True)
+class AverageLatencyResult(ResultRecord):
+    """Average latency of `LatencyTest` (no per-sample data)."""
+    test_type: ClassVar[str] = "latency"
+    engine_name: str
+    iterations: int
+    avg_latency_ms: float
+    clock_calibration: ClockCalibration
+
+
+@dataclass(slots=True)
+class StressMeasurement(ResultRecord):
+    """Statistics and raw durations (ms) of one stress type."""
+    min_ms: float
+    max_ms: float
+    avg_ms: float
+    raw_data_ms: Samples = field(repr=False)
+
+
+@dataclass(slots=True)
+class StressResult(ResultRecord):
+    """Results of `StressStrategy`, one measurement per stress type."""
+    test_type: ClassVar[str] = "stress"
+    engine_name: str
+    iterations: int
+    cpu_stress_ms: StressMeasurement
+    memory_stress_ms: StressMeasurement
+    io_stress_ms: StressMeasurement
+    memory_workload: Dict[str, Any] = field(repr=False)
+    clock_calibration: ClockCalibration
+
+
+@dataclass(slots=True)
+class ComparisonResult(ResultRecord):
+    """Interleaved samples of both engines (compared in `analyze_results`)."""
+    test_type: ClassVar[str] = "comparison"
+    engine_name: str
+    challenger_name: str
+    baseline_latencies_ns: array = field(repr=False)
+    challenger_latencies_ns: array = field(repr=False)
+    block_size: int
+    block_order: array = field(repr=False)  # 0 = baseline, 1 = challenger, per block
+    clock_calibration: ClockCalibration
+
+
+@dataclass(slots=True)
+class SoakResult(ResultRecord):
+    """Soak report built from the on-disk segments."""
+    test_type: ClassVar[str] = "soak"
+    engine_name: str
+    segment_dir: str
+    resumed_segments: int
+    samples: int  # Operations measured by this run (the report also covers resumed segments)
+    report: Dict[str, Any] = field(repr=False)
+
+
+# Types `dumps` can encode by field, keyed by the name stored in the header
+RECORD_TYPES: Dict[str, type] = {
+    cls.__name__: cls for cls in (
+        LatencySummary, LatencyResult, AverageLatencyResult, StressMeasurement,
+        StressResult, ComparisonResult, SoakResult, SampleTags, ClockCalibration,
+    )
+}
+
+
+def record_fields(value: Any) -> List[str]:
+    """Field names of a record type (dataclass fields or `__slots__`)."""
+    if is_dataclass(value):
+        return [f.name for f in fields(value)]
+    return list(type(value).__slots__)
+
+
+def _encode(value: Any, columns: List[array]) -> Any:
+    if isinstance(value, array):
+        columns.append(value)
+        return {"$a": len(columns) - 1}
+    if RECORD_TYPES.get(type(value).__name__) is type(value):
+        return {
+            "$r": type(value).__name__,
+            "f": {name: _encode(getattr(value, name), columns) for name in record_fields(value)},
+        }
+    if isinstance(value, dict):
+        return {key: _encode(v, columns) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v, columns) for v in value]
+    return value
+
+
+def _decode(value: Any, columns: List[array]) -> Any:
+    if isinstance(value, dict):
+        if "$a" in value:
+            return columns[value["$a"]]
+        if "$r" in value:
+            record_type = RECORD_TYPES.get(value["$r"])
+            if record_type is None:
+                raise ValueError(f"Unknown record type: {value['$r']}")
+            record = record_type.__new__(record_type)
+            for name, v in value["f"].items():
+                # object.__setattr__ also covers frozen dataclasses
+                object.__setattr__(record, name, _decode(v, columns))
+            return record
+        return {key: _decode(v, columns) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v, columns) for v in value]
+    return value
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serializes a record (or plain dicts/lists of records, arrays and scalars).
+
+    Returns:
+        bytes: Magic, JSON header, then the raw bytes of every array column
+    """
+    columns: List[array] = []
+    tree = _encode(value, columns)
+    header = json.dumps({
+        "byteorder": sys.byteorder,
+        "columns": [[column.typecode, len(column) * column.itemsize] for column in columns],
+        "tree": tree,
+    }).encode()
+    return b"".join([_HEADER.pack(RECORD_MAGIC, len(header)), header] + [column.tobytes() for column in columns])
+
+
+def loads(data: bytes) -> Any:
+    """Inverse of `dumps`; raises ValueError on data that is not a record."""
+    if len(data) < _HEADER.size:
+        raise ValueError("Truncated result record")
+    magic, header_len = _HEADER.unpack_from(data)
+    if magic != RECORD_MAGIC:
+        raise ValueError("Not a result record")
+    offset = _HEADER.size + header_len
+    header = json.loads(data[_HEADER.size:offset])
+
+    columns: List[array] = []
+    view = memoryview(data)
+    for typecode, nbytes in header["columns"]:
+        column = array(typecode)
+        column.frombytes(view[offset:offset + nbytes])
+        if header["byteorder"] != sys.byteorder:
+            column.byteswap()
+        columns.append(column)
+        offset += nbytes
+    if offset != len(data):
+        raise ValueError("Truncated result record")
+    return _decode(header["tree"], columns)
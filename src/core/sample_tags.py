@@ -0,0 +1,105 @@
+import random
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+import polars as pl
+
+# Default order mix used to tag latency samples: dimension -> possible values
+DEFAULT_ORDER_MIX: Dict[str, List[Any]] = {
+    "symbol": ["TEST/USD", "BTC/USD", "ETH/USD", "EUR/USD"],
+    "size": [1, 10, 100],
+    "order_type": ["limit", "market"],
+}
+
+# Narrowest array typecode (and matching polars dtype) for a number of categories
+_CODE_TYPES = (("B", 1 << 8, pl.UInt8), ("H", 1 << 16, pl.UInt16), ("I", 1 << 32, pl.UInt32))
+
+
+def _code_typecode(categories: int) -> str:
+    for typecode, limit, _ in _CODE_TYPES:
+        if categories <= limit:
+            return typecode
+    raise ValueError(f"Too many categories for one tag dimension: {categories}")
+
+
+class SampleTags:
+    """
+    Compact columnar tags recorded alongside latency samples.
+
+    Each dimension is kept as an array of category codes (one byte per
+    sample, two or four for dimensions with more than 256 or 65536
+    values); the category values are stored once per dimension. Tags are
+    generated up front by `generate`, so the measurement loop only has to
+    look up the order for iteration i and append its latency.
+    """
+    __slots__ = ("categories", "codes")
+
+    def __init__(self, categories: Dict[str, Sequence[Any]], codes: Dict[str, array]):
+        self.categories = {dim: list(values) for dim, values in categories.items()}
+        self.codes = codes
+
+    @classmethod
+    def generate(
+        cls,
+        iterations: int,
+        order_mix: Dict[str, Sequence[Any]] = None,
+        seed: Optional[int] = None
+    ) -> "SampleTags":
+        """Draws `iterations` random tag combinations from `order_mix`."""
+        order_mix = order_mix or DEFAULT_ORDER_MIX
+        rng = random.Random(seed)
+        codes = {
+            dim: array(_code_typecode(len(values)), rng.choices(range(len(values)), k=iterations))
+            for dim, values in order_mix.items()
+        }
+        return cls(order_mix, codes)
+
+    def values(self, dimension: str) -> List[Any]:
+        """Decoded tag values of `dimension`, one per sample."""
+        lookup = self.categories[dimension]
+        return [lookup[code] for code in self.codes[dimension]]
+
+    def to_frame(self, latencies_ns: Sequence[int]) -> pl.DataFrame:
+        """Builds a polars frame of the samples with one Enum column per dimension."""
+        columns = {"latency_ns": pl.Series("latency_ns", latencies_ns, dtype=pl.Int64)}
+        dtypes = {typecode: dtype for typecode, _, dtype in _CODE_TYPES}
+        for dim, codes in self.codes.items():
+            labels = [str(v) for v in self.categories[dim]]
+            columns[dim] = (
+                pl.Series(dim, codes[:len(latencies_ns)], dtype=dtypes[codes.typecode])
+                .replace_strict(list(range(len(labels))), labels, return_dtype=pl.Enum(labels))
+            )
+        return pl.DataFrame(columns)
+
+
+def latency_breakdown(
+    frame: pl.DataFrame,
+    dimensions: Sequence[str],
+    percentiles: Sequence[int] = (50, 90, 99)
+) -> Dict[str, pl.DataFrame]:
+    """
+    Computes per-dimension latency statistics with a vectorized group-by.
+
+    Args:
+        frame: Frame from `SampleTags.to_frame`
+        dimensions: Tag columns to break down by
+        percentiles: Percentiles to compute for each group
+
+    Returns:
+        Dict[str, pl.DataFrame]: Dimension -> one row per tag value (in ms)
+    """
+    latency_ms = pl.col("latency_ns") / 1_000_000
+    aggregations = [
+        pl.len().alias("samples"),
+        latency_ms.mean().alias("avg_ms"),
+        *[latency_ms.quantile(p / 100, interpolation="linear").alias(f"p{p}_ms") for p in percentiles],
+        latency_ms.max().alias("max_ms"),
+    ]
+    return {
+        dim: frame.group_by(dim).agg(aggregations).sort(dim)
+        for dim in dimensions
+    }
+
+
+def frame_to_table(frame: pl.DataFrame) -> List[List[Any]]:
+    """Converts a frame to the header + rows layout used by `result.table.log`."""
+    return [frame.columns] + [list(row) for row in frame.rows()]
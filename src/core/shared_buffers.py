@@ -0,0 +1,165 @@
+import contextlib
+import os
+import secrets
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, Set
+from core.results import ResultRecord, record_fields
+
+try:
+    import numpy as np
+except ImportError:  # Views fall back to typed memoryviews
+    np = None
+
+# Marker key identifying a shared buffer handle inside result/attachment dicts
+HANDLE_KEY = "shm_name"
+
+# Opt-in switch for shared-memory samples in the plan's strategies
+SHARED_MEMORY_ENV = "TESTPACK_SHARED_MEMORY"
+
+# Segment name prefix of this plan. Set on import in the main process and
+# inherited by the worker processes it starts, so the main process can find
+# (and release) segments created by any worker.
+SEGMENT_PREFIX_ENV = "TESTPACK_SHM_PREFIX"
+os.environ.setdefault(SEGMENT_PREFIX_ENV, f"tp{os.getpid()}_")
+
+# Linux exposes POSIX shared memory segments here
+SHM_DIR = "/dev/shm"
+
+# Names of the segments created by this process and not released yet
+_CREATED: Set[str] = set()
+
+
+def shared_memory_requested() -> bool:
+    return os.environ.get(SHARED_MEMORY_ENV, "").lower() in ("1", "true", "yes")
+
+
+class SharedSampleBuffer:
+    """
+    Fixed-length array of samples allocated in `multiprocessing.shared_memory`.
+
+    Strategies write samples straight into the buffer and only the small
+    `handle` dict travels through the results and the Testplan report;
+    readers in another process attach to the same memory and get a
+    zero-copy view instead of an unpickled list.
+
+    Lifetime: the main process of the plan owns every segment, wherever it
+    was created. The creating process (e.g. a pool worker) stops tracking
+    the segment, so it survives the worker exiting, and names it with the
+    plan's prefix (`SEGMENT_PREFIX_ENV`). The main process adopts all
+    segments carrying the prefix in `release_all`, which the plan calls once
+    the report plugins are done; `release` frees one buffer earlier.
+    """
+    __slots__ = ("_shm", "typecode", "length")
+
+    def __init__(self, shm: shared_memory.SharedMemory, typecode: str, length: int):
+        self._shm = shm
+        self.typecode = typecode
+        self.length = length
+
+    @classmethod
+    def create(cls, length: int, typecode: str = "q") -> "SharedSampleBuffer":
+        """Allocates a zeroed buffer for `length` samples of `typecode` ('q' int64, 'd' float64)."""
+        itemsize = memoryview(b"\0" * 8).cast(typecode).itemsize
+        name = os.environ[SEGMENT_PREFIX_ENV] + secrets.token_hex(4)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(length * itemsize, 1))
+        # Owned by the plan's main process, not by this (possibly short-lived) one
+        resource_tracker.unregister(shm._name, "shared_memory")
+        _CREATED.add(shm.name)
+        return cls(shm, typecode, length)
+
+    @classmethod
+    def attach(cls, handle: Dict[str, Any]) -> "SharedSampleBuffer":
+        """Attaches to the buffer described by `handle`."""
+        shm = shared_memory.SharedMemory(name=handle[HANDLE_KEY])
+        return cls(shm, handle["typecode"], handle["length"])
+
+    @property
+    def handle(self) -> Dict[str, Any]:
+        """Small, picklable/JSON-able description of the buffer."""
+        return {HANDLE_KEY: self._shm.name, "typecode": self.typecode, "length": self.length}
+
+    def raw_view(self) -> memoryview:
+        """Typed memoryview of the samples; cheapest for per-sample writes."""
+        return self._shm.buf.cast(self.typecode)[:self.length]
+
+    def view(self):
+        """Zero-copy view of the samples (NumPy array if available, else memoryview)."""
+        mv = self.raw_view()
+        if np is not None:
+            return np.frombuffer(mv, dtype=np.dtype(self.typecode), count=self.length)
+        return mv
+
+    def close(self) -> None:
+        # A view that escaped its `with` block keeps the mapping alive until collected
+        with contextlib.suppress(BufferError):
+            self._shm.close()
+
+    def unlink(self) -> None:
+        """Frees the shared memory segment; no process can attach afterwards."""
+        _CREATED.discard(self._shm.name)
+        self._shm.unlink()
+
+
+def is_shared_handle(value: Any) -> bool:
+    return isinstance(value, dict) and HANDLE_KEY in value
+
+
+def contains_shared_handles(value: Any) -> bool:
+    """True if `value` (nested records/dicts/lists) references any shared buffer."""
+    if is_shared_handle(value):
+        return True
+    if isinstance(value, ResultRecord):
+        return any(contains_shared_handles(getattr(value, name)) for name in record_fields(value))
+    if isinstance(value, dict):
+        return any(contains_shared_handles(v) for v in value.values())
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (dict, list, tuple)):
+        # Only containers can hold handles; flat sample lists are skipped
+        return any(contains_shared_handles(v) for v in value)
+    return False
+
+
+@contextlib.contextmanager
+def open_samples(value: Any) -> Iterator[Any]:
+    """
+    Yields a sequence of samples for `value`, which is either a plain
+    sequence (yielded as-is) or a shared buffer handle (yielded as a
+    zero-copy view that is only valid inside the `with` block).
+    """
+    if not is_shared_handle(value):
+        yield value
+        return
+    buffer = SharedSampleBuffer.attach(value)
+    view = buffer.view()
+    try:
+        yield view
+    finally:
+        del view
+        buffer.close()
+
+
+def release(value: Any) -> None:
+    """Unlinks the shared buffer behind `value`, if it is a handle."""
+    if is_shared_handle(value):
+        _CREATED.discard(value[HANDLE_KEY])
+        with contextlib.suppress(FileNotFoundError):
+            shm = shared_memory.SharedMemory(name=value[HANDLE_KEY])
+            shm.close()
+            shm.unlink()
+
+
+def release_all() -> int:
+    """
+    Unlinks every shared buffer of this plan that is still alive: those
+    created by this process and, where segments can be listed, those
+    created by worker processes.
+
+    Returns:
+        int: Number of buffers released
+    """
+    names = set(_CREATED)
+    if os.path.isdir(SHM_DIR):
+        prefix = os.environ[SEGMENT_PREFIX_ENV]
+        names.update(name for name in os.listdir(SHM_DIR) if name.startswith(prefix))
+    for name in names:
+        release({HANDLE_KEY: name})
+    return len(names)
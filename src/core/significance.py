@@ -0,0 +1,220 @@
+import itertools
+import math
+import random
+import statistics
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def mann_whitney_u(a: Sequence[float], b: Sequence[float]) -> Tuple[float, float]:
+    """
+    Two-sided Mann-Whitney U test using the normal approximation with tie
+    correction (adequate for the sample sizes used in performance tests).
+
+    Returns:
+        Tuple[float, float]: (U statistic of `a`, p-value)
+    """
+    n_a, n_b = len(a), len(b)
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+
+    # Assign average ranks to tied values
+    rank_sum_a = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        rank_sum_a += avg_rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        i = j + 1
+
+    u_a = rank_sum_a - n_a * (n_a + 1) / 2
+    n = n_a + n_b
+    mean_u = n_a * n_b / 2
+    var_u = n_a * n_b / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return u_a, 1.0
+    # Continuity correction towards the mean
+    z = (abs(u_a - mean_u) - 0.5) / math.sqrt(var_u)
+    return u_a, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2)))
+
+
+def bootstrap_median_diff_ci(
+    a: Sequence[float],
+    b: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    rng: Optional[random.Random] = None
+) -> Tuple[float, float]:
+    """
+    Percentile bootstrap confidence interval for median(b) - median(a).
+
+    Returns:
+        Tuple[float, float]: (lower bound, upper bound)
+    """
+    rng = rng or random.Random()
+    n_a, n_b = len(a), len(b)
+    diffs: List[float] = []
+    for _ in range(resamples):
+        diffs.append(
+            statistics.median(rng.choices(b, k=n_b)) - statistics.median(rng.choices(a, k=n_a))
+        )
+    diffs.sort()
+    tail = (1 - confidence) / 2
+    low = diffs[int(tail * (resamples - 1))]
+    high = diffs[int(math.ceil((1 - tail) * (resamples - 1)))]
+    return low, high
+
+
+def compare_distributions(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Compares two latency distributions.
+
+    The difference is only reported as significant when the Mann-Whitney
+    p-value is below 1 - confidence AND the bootstrap interval of the
+    median difference excludes zero.
+
+    Args:
+        baseline: Samples of the reference engine
+        candidate: Samples of the engine being evaluated
+        confidence: Confidence level for the interval and the test
+        resamples: Number of bootstrap resamples
+        seed: Seed for reproducible intervals
+
+    Returns:
+        Dict[str, Any]: Medians, difference, interval, p-value and verdict
+    """
+    rng = random.Random(seed)
+    baseline_median = statistics.median(baseline)
+    candidate_median = statistics.median(candidate)
+    ci_low, ci_high = bootstrap_median_diff_ci(baseline, candidate, confidence, resamples, rng)
+    _, p_value = mann_whitney_u(baseline, candidate)
+
+    return _summarize(baseline_median, candidate_median, confidence, ci_low, ci_high, p_value)
+
+
+def sign_flip_test(diffs: Sequence[float], resamples: int = 2000, rng: Optional[random.Random] = None) -> float:
+    """
+    Two-sided paired randomization test of mean(diffs) == 0: under the null
+    hypothesis each difference is equally likely to have either sign. All
+    2^n sign patterns are enumerated when there are at most `resamples`.
+
+    Returns:
+        float: p-value
+    """
+    n = len(diffs)
+    if not n:
+        return 1.0
+    observed = abs(sum(diffs))
+    # Tolerance for float summation order
+    threshold = observed - 1e-9 * sum(abs(d) for d in diffs)
+    if 2 ** n <= resamples:
+        signs = itertools.product((1, -1), repeat=n)
+        extreme = sum(1 for pattern in signs if abs(sum(s * d for s, d in zip(pattern, diffs))) >= threshold)
+        return extreme / 2 ** n
+    rng = rng or random.Random()
+    extreme = sum(
+        1 for _ in range(resamples)
+        if abs(sum(d if rng.random() < 0.5 else -d for d in diffs)) >= threshold
+    )
+    return (extreme + 1) / (resamples + 1)
+
+
+def compare_paired_blocks(
+    baseline: Sequence[float],
+    candidate: Sequence[float],
+    block_size: int,
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Compares two latency distributions measured in interleaved blocks.
+
+    Block k of `baseline` and block k of `candidate` (`block_size` samples
+    each, the last one possibly shorter) ran back to back and form a pair.
+    Samples within a block share the machine state of that moment, so the
+    pairs, not the samples, are the independent units: the interval
+    bootstraps pairs of blocks and the p-value comes from a sign-flip test
+    on the per-pair median differences.
+
+    Args:
+        baseline: Samples of the reference engine, in block order
+        candidate: Samples of the engine being evaluated, in block order
+        block_size: Samples per block
+        confidence: Confidence level for the interval and the test
+        resamples: Number of bootstrap resamples (and sign-flip permutations)
+        seed: Seed for reproducible intervals
+
+    Returns:
+        Dict[str, Any]: Same keys as `compare_distributions`, plus the
+        number of pairs and the median of the per-pair differences
+    """
+    if len(baseline) != len(candidate):
+        raise ValueError(f"Paired blocks need as many baseline as candidate samples ({len(baseline)} != {len(candidate)})")
+    pairs = [
+        (baseline[start:start + block_size], candidate[start:start + block_size])
+        for start in range(0, len(baseline), block_size)
+    ]
+    rng = random.Random(seed)
+
+    diffs: List[float] = []
+    for _ in range(resamples):
+        drawn = rng.choices(pairs, k=len(pairs))
+        diffs.append(
+            statistics.median([v for _, block in drawn for v in block])
+            - statistics.median([v for block, _ in drawn for v in block])
+        )
+    diffs.sort()
+    tail = (1 - confidence) / 2
+    ci_low = diffs[int(tail * (resamples - 1))]
+    ci_high = diffs[int(math.ceil((1 - tail) * (resamples - 1)))]
+
+    pair_diffs = [statistics.median(c) - statistics.median(b) for b, c in pairs]
+    p_value = sign_flip_test(pair_diffs, resamples, rng)
+
+    comparison = _summarize(
+        statistics.median(baseline), statistics.median(candidate), confidence, ci_low, ci_high, p_value
+    )
+    comparison["pairs"] = len(pairs)
+    comparison["pair_median_diff"] = statistics.median(pair_diffs)
+    return comparison
+
+
+def _summarize(
+    baseline_median: float,
+    candidate_median: float,
+    confidence: float,
+    ci_low: float,
+    ci_high: float,
+    p_value: float
+) -> Dict[str, Any]:
+    significant = p_value < (1 - confidence) and (ci_low > 0 or ci_high < 0)
+    diff = candidate_median - baseline_median
+    if not significant:
+        verdict = "no significant difference"
+    elif diff < 0:
+        verdict = "candidate faster"
+    else:
+        verdict = "candidate slower"
+
+    return {
+        "baseline_median": baseline_median,
+        "candidate_median": candidate_median,
+        "median_diff": diff,
+        "relative_diff": diff / baseline_median if baseline_median else float("nan"),
+        "confidence": confidence,
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "p_value": p_value,
+        "significant": significant,
+        "verdict": verdict,
+    }
@@ -0,0 +1,171 @@
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from core.histogram import LatencyHistogram
+from core.timing import now_ns
+
+# Rollup granularities: name -> strftime key of the UTC bucket
+ROLLUPS = {
+    "hourly": "%Y-%m-%dT%H:00Z",
+    "daily": "%Y-%m-%d",
+}
+
+# Written by `SoakRecorder.finalize`; a directory without it holds an interrupted soak
+COMPLETE_MARKER = "complete.json"
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Atomic write, so an interruption never leaves a truncated file behind."""
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def rollup_segment(segment_dir: Path, segment_path: Path) -> None:
+    """Merges one segment into its hourly and daily rollups (idempotent)."""
+    segment = _read_json(segment_path)
+    wall_start = datetime.fromtimestamp(segment["wall_start_ns"] / 1_000_000_000, tz=timezone.utc)
+    for granularity, key_format in ROLLUPS.items():
+        key = wall_start.strftime(key_format)
+        path = segment_dir / f"rollup-{granularity}-{key.replace(':', '')}.json"
+        rollup = _read_json(path) if path.exists() else {
+            "granularity": granularity, "bucket": key, "segments": [],
+            "histogram": LatencyHistogram().to_dict()
+        }
+        if segment["id"] in rollup["segments"]:
+            continue
+        histogram = LatencyHistogram.from_dict(rollup["histogram"])
+        histogram.merge(LatencyHistogram.from_dict(segment["histogram"]))
+        rollup["histogram"] = histogram.to_dict()
+        rollup["segments"].append(segment["id"])
+        _write_json(path, rollup)
+
+
+def reconcile_rollups(segment_dir: Path) -> None:
+    """Rolls up every segment on disk that an interrupted run did not finish rolling up."""
+    for path in SoakRecorder.segment_files(segment_dir):
+        rollup_segment(segment_dir, path)
+
+
+class SoakRecorder:
+    """
+    Bounded-memory recorder for long soak runs.
+
+    Samples go into a histogram for the current time segment only. Every
+    `segment_interval_s` the segment is written to `segment_dir` and merged
+    into the hourly and daily rollup files, then dropped from memory, so
+    memory stays flat regardless of the run duration.
+
+    Segment files are the source of truth. Each rollup lists the segments it
+    already contains, so rolling up is idempotent: after an interruption a
+    new recorder on the same directory resumes where the last flushed
+    segment ended, and `finalize` (or `build_report` on the directory alone)
+    reconciles any segment that was written but not yet rolled up.
+    `finalize` also marks the directory complete (see `is_complete`).
+    """
+
+    def __init__(self, segment_dir: str, segment_interval_s: float = 60.0):
+        self.segment_dir = Path(segment_dir)
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_interval_ns = int(segment_interval_s * 1_000_000_000)
+        # Maps the framework clock onto wall-clock time for the rollup buckets
+        self._wall_offset_ns = time.time_ns() - now_ns()
+
+        segments = self.segment_files(self.segment_dir)
+        self.resumed_segments = len(segments)
+        self.recorded_duration_ns = sum(_read_json(p)["duration_ns"] for p in segments)
+        self._next_id = int(segments[-1].stem.split("-")[1]) + 1 if segments else 0
+        reconcile_rollups(self.segment_dir)
+        self._open_segment(now_ns())
+
+    @staticmethod
+    def is_complete(segment_dir: str) -> bool:
+        """True once `finalize` has run on `segment_dir`."""
+        return (Path(segment_dir) / COMPLETE_MARKER).exists()
+
+    @staticmethod
+    def segment_files(segment_dir: Path) -> List[Path]:
+        return sorted(Path(segment_dir).glob("segment-*.json"))
+
+    def _open_segment(self, start_ns: int) -> None:
+        self._histogram = LatencyHistogram()
+        self._segment_start_ns = start_ns
+        self._segment_end_ns = start_ns + self.segment_interval_ns
+
+    def record(self, timestamp_ns: int, latency_ns: int) -> None:
+        """Records one sample taken at `timestamp_ns` (framework clock)."""
+        if timestamp_ns >= self._segment_end_ns:
+            self.flush(timestamp_ns)
+        self._histogram.record(latency_ns)
+
+    def flush(self, until_ns: Optional[int] = None) -> Optional[Path]:
+        """
+        Writes the current segment (if it holds samples), rolls it up and starts a new one.
+
+        Returns:
+            Optional[Path]: The segment file written, if any
+        """
+        until_ns = until_ns if until_ns is not None else now_ns()
+        path = None
+        if self._histogram.count:
+            path = self.segment_dir / f"segment-{self._next_id:08d}.json"
+            _write_json(path, {
+                "id": self._next_id,
+                "wall_start_ns": self._segment_start_ns + self._wall_offset_ns,
+                "duration_ns": until_ns - self._segment_start_ns,
+                "histogram": self._histogram.to_dict(),
+            })
+            self._next_id += 1
+            self.recorded_duration_ns += until_ns - self._segment_start_ns
+            rollup_segment(self.segment_dir, path)
+        self._open_segment(until_ns)
+        return path
+
+    def finalize(self) -> Dict[str, Any]:
+        """Flushes the open segment, marks the soak complete and builds the report from the files on disk."""
+        self.flush()
+        _write_json(self.segment_dir / COMPLETE_MARKER, {"recorded_duration_ns": self.recorded_duration_ns})
+        return self.build_report(self.segment_dir)
+
+    @classmethod
+    def build_report(cls, segment_dir: str) -> Dict[str, Any]:
+        """
+        Builds the soak report from a segment directory, e.g. after a crash.
+
+        Returns:
+            Dict[str, Any]: Overall summary plus hourly and daily rollup summaries (ms)
+        """
+        segment_dir = Path(segment_dir)
+        reconcile_rollups(segment_dir)
+        total = LatencyHistogram()
+        duration_ns = 0
+        segments = cls.segment_files(segment_dir)
+        for path in segments:
+            segment = _read_json(path)
+            total.merge(LatencyHistogram.from_dict(segment["histogram"]))
+            duration_ns += segment["duration_ns"]
+
+        report: Dict[str, Any] = {
+            "segments": len(segments),
+            "duration_s": duration_ns / 1_000_000_000,
+            "summary": total.summary(),
+        }
+        for granularity in ROLLUPS:
+            rows = []
+            for path in sorted(segment_dir.glob(f"rollup-{granularity}-*.json")):
+                rollup = _read_json(path)
+                rows.append({
+                    "bucket": rollup["bucket"],
+                    **LatencyHistogram.from_dict(rollup["histogram"]).summary()
+                })
+            report[granularity] = rows
+        return report
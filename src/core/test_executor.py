@@ -1,5 +1,28 @@
+import threading
 from core.interfaces import ITestStrategy, IEngine, IPlugin
-from typing import Dict, Any, List
+from core.results import ResultRecord
+from typing import List, Sequence
+
+# Samples between progress reports of long-running strategies
+PROGRESS_INTERVAL = 1_000
+
+# Executor running a test on the current thread (testcases run on worker threads)
+_running = threading.local()
+
+
+def report_progress(engine_name: str, test_type: str, latencies_ns: Sequence[int]) -> None:
+    """
+    Hands the latencies measured since the last report to the plugins of the
+    executor running on this thread, so live metrics move during a test.
+    Strategies call it every PROGRESS_INTERVAL samples and may reuse the
+    buffer afterwards, so plugins must not keep `latencies_ns`. Outside an
+    executor it does nothing.
+    """
+    executor = getattr(_running, "executor", None)
+    if executor is not None:
+        for plugin in executor._plugins:
+            plugin.on_test_progress(engine_name, test_type, latencies_ns)
+
 
 class TestExecutor:
     """The Context that uses the Strategy and manages Plugins."""
@@ -11,8 +34,11 @@ class TestExecutor:
         """Allows runtime strategy change."""
         self._strategy = strategy
 
-    def execute_test(self, engine: IEngine, iterations: int) -> Dict[str, Any]:
-        """Executes the test using the current strategy and notifies plugins."""
+    def execute_test(self, engine: IEngine, iterations: int, **kwargs) -> ResultRecord:
+        """
+        Executes the test using the current strategy and notifies plugins.
+        Extra keyword arguments (e.g. a comparison `challenger`) go to the strategy.
+        """
         
         # Notify plugins of test start
         for plugin in self._plugins:
@@ -20,8 +46,12 @@ class TestExecutor:
 
         print(f"Executing {self._strategy.test_type} test on {engine.name}...")
         
-        # Run the test
-        results = self._strategy.execute_test(engine, iterations)
+        # Run the test (progress reports go to this executor's plugins)
+        _running.executor = self
+        try:
+            results = self._strategy.execute_test(engine, iterations, **kwargs)
+        finally:
+            _running.executor = None
         
         # Notify plugins of test completion
         for plugin in self._plugins:
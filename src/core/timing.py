@@ -0,0 +1,86 @@
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# Candidate clocks, all returning integer nanoseconds
+CLOCKS: Dict[str, Callable[[], int]] = {
+    "perf_counter": time.perf_counter_ns,
+    "monotonic": time.monotonic_ns,
+    "time": time.time_ns,
+}
+
+# The single high-resolution clock used by every strategy and driver
+CLOCK_NAME = "perf_counter"
+now_ns = CLOCKS[CLOCK_NAME]
+
+# Set to 1 to remove the calibrated clock read cost from every latency sample
+SUBTRACT_OVERHEAD_ENV = "TESTPACK_SUBTRACT_TIMER_OVERHEAD"
+
+
+def overhead_subtraction_requested() -> bool:
+    """True when SUBTRACT_OVERHEAD_ENV asks for timer overhead subtraction."""
+    return os.environ.get(SUBTRACT_OVERHEAD_ENV, "").lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class ClockCalibration:
+    """Measured properties of a clock on the current machine."""
+    clock: str
+    reported_resolution_ns: float  # As advertised by the OS (time.get_clock_info)
+    resolution_ns: float           # Smallest non-zero step actually observed
+    read_overhead_ns: float        # Median of two back-to-back reads (an empty measurement)
+    monotonic: bool                # Advertised monotonic and never observed going backwards
+    samples: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def calibrate_clock(clock_name: str = CLOCK_NAME, samples: int = 50_000) -> ClockCalibration:
+    """
+    Calibrates `clock_name` by taking `samples` back-to-back read pairs.
+
+    Args:
+        clock_name: Key into CLOCKS
+        samples: Number of read pairs to take
+
+    Returns:
+        ClockCalibration: Resolution, read overhead and monotonicity of the clock
+    """
+    clock = CLOCKS[clock_name]
+    info = time.get_clock_info(clock_name)
+
+    deltas = []
+    for _ in range(samples):
+        start = clock()
+        end = clock()
+        deltas.append(end - start)
+
+    non_zero = [d for d in deltas if d > 0]
+    return ClockCalibration(
+        clock=clock_name,
+        reported_resolution_ns=info.resolution * 1_000_000_000,
+        resolution_ns=float(min(non_zero)) if non_zero else info.resolution * 1_000_000_000,
+        read_overhead_ns=float(statistics.median(deltas)),
+        monotonic=info.monotonic and min(deltas) >= 0,
+        samples=samples,
+    )
+
+
+_CALIBRATION: Optional[ClockCalibration] = None
+
+
+def get_calibration() -> ClockCalibration:
+    """Returns the calibration of the framework clock, calibrating on first use."""
+    global _CALIBRATION
+    if _CALIBRATION is None:
+        _CALIBRATION = calibrate_clock()
+    return _CALIBRATION
+
+
+def subtract_overhead(samples_ns: List[int], calibration: ClockCalibration) -> List[int]:
+    """Removes the clock read overhead from each sample, clamping at zero."""
+    overhead = int(calibration.read_overhead_ns)
+    return [s - overhead if s > overhead else 0 for s in samples_ns]
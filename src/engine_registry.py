@@ -5,6 +5,7 @@ from engines.engine_a import ConcreteEngineA
 from test_types.latency_test import LatencyTest
 # Import other test types/strategies
 from plugins.data_reporter import DataReporterPlugin # Example plugin
+from plugins.openmetrics_exporter import get_exporter
 from typing import Type, List, Dict
 
 # Global map for which tests to run on which engine
@@ -42,4 +43,9 @@ register_plugins([
         output_file='performance_report.txt',
         report_format='text'
     )
-])
\ No newline at end of file
+])
+
+# 3. Live OpenMetrics endpoint, opt-in via TESTPACK_METRICS_PORT
+if get_exporter():
+    PLUGINS.append(get_exporter())
+    print(f"Registered Plugin: {get_exporter().name} ({get_exporter().url})")
\ No newline at end of file
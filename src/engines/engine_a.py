@@ -7,8 +7,9 @@ class ConcreteEngineA(IEngine):
     def name(self) -> str:
         return "EngineA_LowLatency"
 
-    def execute_trade(self, order: Dict[str, Any]) -> Any:
+    def execute_trade(self, order: Dict[str, Any]) -> int:
         # Simulate very fast execution
         # time.sleep(0.000001) 
-        return {"status": "executed", "engine": self.name, "timestamp": time.time()}
+        # Execution timestamp (ns) rather than a new status dict per trade
+        return time.time_ns()
     
\ No newline at end of file
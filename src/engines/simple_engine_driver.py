@@ -1,6 +1,6 @@
-import time
 from testplan.testing.multitest.driver.base import Driver
-from time import perf_counter_ns, sleep
+from time import sleep
+from core.timing import now_ns
 from typing import Dict, Any
 from rich import print as rprint
 
@@ -29,10 +29,10 @@ class SimpleEngineDriver(Driver):
         self._base_latency_ns = 50 if self._engine_name == "Alpha" else 150
         print(f"Engine {self._engine_name} started.")
 
-    def execute_trade(self, symbol: str, volume: int) -> int:
+    def execute_trade(self, symbol: str, volume: int, order_type: str = "limit") -> int:
         """Simulates an order execution and returns latency in nanoseconds."""
         # rprint("[blue]Executing trade...[/blue]")
-        start = perf_counter_ns()
+        start = now_ns()
         
         # Simulate engine work (e.g., matching logic, IO, etc.)
         # This is where engine-specific complexity would reside (SRP for Engine)
@@ -40,7 +40,7 @@ class SimpleEngineDriver(Driver):
         # rprint("[blue]Trade executed.[/blue]")
         # rprint(f"Engine {self._engine_name} executed trade for {symbol} volume {volume}.")
 
-        end = perf_counter_ns()
+        end = now_ns()
         # rprint(f"Trade latency: {end - start} ns")
         # rprint(f"[bold blue]Engine {self._engine_name} trade latency: {end - start} ns[/bold blue]")
         return end - start
@@ -62,7 +62,7 @@ class SimpleEngineDriver(Driver):
         Returns:
             float: Operation duration in nanoseconds
         """
-        start_time = time.time_ns()
+        start_time = now_ns()
         
         if operation == "write":
             # Simulate write operation
@@ -74,4 +74,4 @@ class SimpleEngineDriver(Driver):
             with open('/dev/zero', 'rb') as f:
                 f.read(size_bytes)
                 
-        return time.time_ns() - start_time
\ No newline at end of file
+        return now_ns() - start_time
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Downsampled time-series reporting for large runs.
+
+Raw runs can hold millions of samples, far more than any plot can show. This
+module reduces a (timestamp, latency) series to a fixed point budget:
+
+- an LTTB (Largest-Triangle-Three-Buckets) line that keeps the visual shape,
+  including isolated spikes
+- per-bucket min/max/percentile bands, so the distribution within each
+  time slice is not lost
+
+The resulting JSON and the self-contained HTML report have a size that
+depends on the point budget only, not on the number of iterations.
+"""
+import html
+import json
+from typing import Any, Dict, List, Sequence, Tuple
+import polars as pl
+
+DEFAULT_POINT_BUDGET = 1000
+DEFAULT_BAND_BUCKETS = 200
+DEFAULT_BAND_PERCENTILES = (50, 99)
+
+
+def lttb(xs: Sequence[float], ys: Sequence[float], threshold: int) -> Tuple[List[float], List[float]]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        xs: Monotonic x values (e.g. timestamps)
+        ys: y values, same length as `xs`
+        threshold: Number of points to keep (>= 3)
+
+    Returns:
+        Tuple[List[float], List[float]]: Selected x and y values
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(xs), list(ys)
+
+    out_x, out_y = [xs[0]], [ys[0]]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0  # Index of the previously selected point
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket is the third triangle vertex
+        next_start, next_end = end, min(int((i + 2) * bucket_size) + 1, n)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        ax, ay = xs[a], ys[a]
+        best_area, best = -1.0, start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best_area, best = area, j
+        out_x.append(xs[best])
+        out_y.append(ys[best])
+        a = best
+
+    out_x.append(xs[-1])
+    out_y.append(ys[-1])
+    return out_x, out_y
+
+
+def percentile_bands(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    buckets: int = DEFAULT_BAND_BUCKETS,
+    percentiles: Sequence[int] = DEFAULT_BAND_PERCENTILES
+) -> Dict[str, List[float]]:
+    """
+    Splits the x range into `buckets` equal slices and computes count,
+    min, max and the requested percentiles of y per slice (polars group-by).
+
+    Returns:
+        Dict[str, List[float]]: Column name -> one value per non-empty bucket
+    """
+    frame = pl.DataFrame({"x": pl.Series(xs, dtype=pl.Float64), "y": pl.Series(ys, dtype=pl.Float64)})
+    x_min, x_max = frame["x"].min(), frame["x"].max()
+    width = (x_max - x_min) / buckets or 1.0
+
+    bands = (
+        frame
+        .with_columns(((pl.col("x") - x_min) / width).floor().clip(0, buckets - 1).cast(pl.Int32).alias("bucket"))
+        .group_by("bucket")
+        .agg(
+            pl.col("x").min().alias("x_start"),
+            pl.col("x").max().alias("x_end"),
+            pl.len().alias("count"),
+            pl.col("y").min().alias("min"),
+            *[pl.col("y").quantile(p / 100, interpolation="linear").alias(f"p{p}") for p in percentiles],
+            pl.col("y").max().alias("max"),
+        )
+        .sort("bucket")
+        .drop("bucket")
+    )
+    return bands.to_dict(as_series=False)
+
+
+def build_timeseries(
+    timestamps_ns: Sequence[int],
+    latencies_ns: Sequence[int],
+    point_budget: int = DEFAULT_POINT_BUDGET,
+    band_buckets: int = DEFAULT_BAND_BUCKETS
+) -> Dict[str, Any]:
+    """
+    Builds the downsampled series of one run (times relative to the first sample, in ms).
+
+    Returns:
+        Dict[str, Any]: JSON-able series with LTTB points and percentile bands
+    """
+    if not len(timestamps_ns):
+        return {"samples": 0, "duration_ms": 0.0, "points": {"t_ms": [], "latency_ms": []}, "bands": {}}
+    t0 = timestamps_ns[0]
+    t_ms = [(t - t0) / 1_000_000 for t in timestamps_ns]
+    latency_ms = [l / 1_000_000 for l in latencies_ns]
+
+    points_t, points_latency = lttb(t_ms, latency_ms, point_budget)
+    return {
+        "samples": len(t_ms),
+        "duration_ms": t_ms[-1],
+        "point_budget": point_budget,
+        "points": {"t_ms": points_t, "latency_ms": points_latency},
+        "bands": percentile_bands(t_ms, latency_ms, band_buckets),
+    }
+
+
+def _svg_chart(series: Dict[str, Any], width: int = 900, height: int = 280) -> str:
+    """Inline SVG: min/max band, p99 and p50 lines and the LTTB line."""
+    bands, points = series["bands"], series["points"]
+    if not points["t_ms"]:
+        return "<p>No samples.</p>"
+    x_max = max(series["duration_ms"], 1e-9)
+    y_max = max(max(bands["max"]), max(points["latency_ms"])) * 1.05 or 1.0
+
+    def sx(x):
+        return f"{x / x_max * width:.1f}"
+
+    def sy(y):
+        return f"{height - y / y_max * height:.1f}"
+
+    def polyline(xs, ys, color, stroke=1.0):
+        coords = " ".join(f"{sx(x)},{sy(y)}" for x, y in zip(xs, ys))
+        return f'<polyline fill="none" stroke="{color}" stroke-width="{stroke}" points="{coords}"/>'
+
+    mids = [(s + e) / 2 for s, e in zip(bands["x_start"], bands["x_end"])]
+    band = " ".join(
+        [f"{sx(x)},{sy(y)}" for x, y in zip(mids, bands["max"])]
+        + [f"{sx(x)},{sy(y)}" for x, y in zip(reversed(mids), reversed(bands["min"]))]
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}" style="background:#fafafa;border:1px solid #ddd">'
+        f'<polygon fill="#cfe2ff" stroke="none" points="{band}"/>'
+        + polyline(mids, bands["p99"], "#d9534f")
+        + polyline(mids, bands["p50"], "#5cb85c")
+        + polyline(points["t_ms"], points["latency_ms"], "#0b5ed7", 0.6)
+        + f'<text x="4" y="12" font-size="11">{y_max:.3f} ms</text></svg>'
+    )
+
+
+def render_html(series_by_test: Dict[str, Dict[str, Any]], title: str = "Latency time series") -> str:
+    """Self-contained HTML report (inline SVG + embedded JSON, no external assets)."""
+    sections = []
+    for test_name, series in series_by_test.items():
+        sections.append(
+            f"<h2>{html.escape(test_name)}</h2>"
+            f"<p>{series['samples']} samples over {series['duration_ms']:.1f} ms, "
+            f"downsampled to {len(series['points']['t_ms'])} points. "
+            "Band: min-max per bucket; red: p99; green: p50; blue: LTTB.</p>"
+            + _svg_chart(series)
+        )
+    data = json.dumps(series_by_test).replace("</", "<\\/")
+    return (
+        f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head>"
+        f"<body style=\"font-family:sans-serif\"><h1>{html.escape(title)}</h1>{''.join(sections)}"
+        f"<script type=\"application/json\" id=\"series-data\">{data}</script></body></html>"
+    )
+
+
+def write_html_report(series_by_test: Dict[str, Dict[str, Any]], path: str, title: str = "Latency time series") -> str:
+    with open(path, "w") as f:
+        f.write(render_html(series_by_test, title))
+    return path
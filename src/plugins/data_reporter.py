@@ -1,5 +1,7 @@
 from testplan.common.config import Config
 from common.plugin import RuntimeType, TestplanPlugin
+from core.attachments import get_attachment_data, summarize_latencies
+from core.results import ResultRecord
 from testplan.report import TestReport
 from typing import Dict, Any
 
@@ -39,7 +41,7 @@ class DataReporterPlugin(TestplanPlugin):
         """Called when a test starts."""
         print(f"\nData Reporter: Starting test for {engine_name} - {test_type}")
 
-    def on_test_complete(self, results: Dict[str, Any]) -> None:
+    def on_test_complete(self, results: ResultRecord) -> None:
         """Called when a test completes."""
         print(f"Data Reporter: Test completed with results: {results}\n")
 
@@ -62,29 +64,40 @@ class DataReporterPlugin(TestplanPlugin):
                     for case in suite.entries:
                         # The attached data, created by the Strategy (e.g., LatencyStrategy), 
                         # should be retrieved using its key: 'LatencyRawData'
-                        raw_data_attachment = case.attachments.get('LatencyRawData')
+                        raw_data_attachment = get_attachment_data(case, 'LatencyRawData')
                         
                         if raw_data_attachment:
-                            latencies_ms = raw_data_attachment.get('latency_data_ms', [])
+                            # Summary record, or a zero-copy view of a shared buffer
+                            try:
+                                latency_stats = summarize_latencies(raw_data_attachment)
+                            except FileNotFoundError:
+                                latency_stats = None  # Shared buffer already released
                             
-                            if latencies_ms:
+                            if latency_stats:
                                 test_id = f"{entry.name}/{case.name}"
                                 
                                 # Perform data summary/serialization
                                 summary = {
                                     "engine": entry.name,
                                     "test_type": "latency", # Based on attachment key
-                                    "data_points": len(latencies_ms),
-                                    "min_ms": min(latencies_ms),
-                                    "max_ms": max(latencies_ms),
-                                    "avg_ms": sum(latencies_ms) / len(latencies_ms)
+                                    **latency_stats.to_dict()
                                 }
                                 
+                                # Per-dimension tables (symbol, size, order type), if recorded
+                                breakdown = get_attachment_data(case, 'LatencyBreakdown')
+                                if breakdown:
+                                    summary["breakdown"] = breakdown
+
                                 test_summary_data[test_id] = summary
 
                                 # --- Reporting/Output Simulation ---
                                 print(f"  > Summary for **{test_id}**:")
                                 print(f"    - AVG Latency: {summary['avg_ms']:.3f} ms")
+                                for dim, table in summary.get("breakdown", {}).items():
+                                    header, rows = table[0], table[1:]
+                                    avg_idx = header.index("avg_ms")
+                                    slowest = max(rows, key=lambda row: row[avg_idx])
+                                    print(f"    - Slowest {dim}: {slowest[0]} ({slowest[avg_idx]:.3f} ms avg)")
                                 
         # Final Output Step
         if test_summary_data:
@@ -1,7 +1,9 @@
 from testplan.common.config import Config
 from common.plugin import RuntimeType, TestplanPlugin
+from core.attachments import get_attachment_data, summarize_latencies
+from core.results import ResultRecord
 from testplan.report import TestReport
-from typing import Dict, Any
+
 
 class MetricReporterConfig(Config):
     """
@@ -28,7 +30,7 @@ class MetricReporterPlugin(TestplanPlugin):
         """Called when a test starts."""
         print(f"\nStarting test: {engine_name} - {test_type}")
 
-    def on_test_complete(self, results: Dict[str, Any]) -> None:
+    def on_test_complete(self, results: ResultRecord) -> None:
         """Called when a test completes."""
         print(f"Test completed with results: {results}\n")
 
@@ -51,19 +53,22 @@ class MetricReporterPlugin(TestplanPlugin):
                 for suite in entry.entries:
                     for case in suite.entries:
                         # The attached data (created by the LatencyStrategy) is retrieved here
-                        raw_data_attachment = case.attachments.get('LatencyRawData')
+                        raw_data_attachment = get_attachment_data(case, 'LatencyRawData')
                         
                         if raw_data_attachment:
-                            # Extract the specific metric list from the attachment dictionary
-                            latencies_ms = raw_data_attachment.get('latency_data_ms')
+                            # Summary record, or summarized from a zero-copy shared buffer view
+                            try:
+                                latency_stats = summarize_latencies(raw_data_attachment)
+                            except FileNotFoundError:
+                                latency_stats = None  # Shared buffer already released
                             
-                            if latencies_ms:
+                            if latency_stats:
                                 print(f"  > Found data for: **{entry.name} / {case.name}**")
                                 
                                 # --- Reporting Logic Simulation ---
-                                min_lat = min(latencies_ms)
-                                max_lat = max(latencies_ms)
-                                count = len(latencies_ms)
+                                min_lat = latency_stats.min_ms
+                                max_lat = latency_stats.max_ms
+                                count = latency_stats.data_points
                                 total_data_points_reported += count
 
                                 # In a real system, this is where you would:
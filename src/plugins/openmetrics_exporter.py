@@ -0,0 +1,311 @@
+import os
+import threading
+from bisect import bisect_left
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from testplan.common.config import Config
+from common.plugin import RuntimeType, TestplanPlugin
+from core.results import ComparisonResult, LatencyResult, ResultRecord, SoakResult
+from core.shared_buffers import open_samples
+from core.timing import now_ns
+from testplan.report import TestReport
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Bucketing falls back to a bisect loop
+    np = None
+
+# Setting a port enables the endpoint for TestExecutor runs (0 picks a free port)
+METRICS_PORT_ENV = "TESTPACK_METRICS_PORT"
+DEFAULT_HOST = "127.0.0.1"
+
+# Latency histogram bucket upper bounds (seconds)
+LATENCY_BUCKETS_S = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.1,
+)
+_BUCKETS_NS = [int(b * 1_000_000_000) for b in LATENCY_BUCKETS_S]
+_BUCKETS_NS_ARRAY = np.array(_BUCKETS_NS, dtype=np.int64) if np is not None else None
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Key = Tuple[str, str]  # (engine, test_type)
+# Latency histogram increment: (bucket counts, last bucket +Inf), sum (ns), count
+Observation = Tuple[List[int], int, int]
+
+
+class OpenMetricsConfig(Config):
+    """Configuration for the OpenMetrics exporter (listen address)."""
+    @classmethod
+    def get_options(cls) -> Dict:
+        return {
+            'host': str,
+            'port': int,
+        }
+
+
+class _EngineTestMetrics:
+    """Metric values of one engine/test combination."""
+    __slots__ = ("started", "completed", "samples", "duration_ns", "throughput",
+                 "bucket_counts", "latency_sum_ns", "latency_count", "running_since")
+
+    def __init__(self):
+        self.started = 0
+        self.completed = 0
+        self.samples = 0
+        self.duration_ns = 0
+        self.throughput = 0.0
+        self.bucket_counts = [0] * (len(_BUCKETS_NS) + 1)  # Last bucket is +Inf
+        self.latency_sum_ns = 0
+        self.latency_count = 0
+        self.running_since: List[int] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(key: Key, **extra: str) -> str:
+    pairs = [("engine", key[0]), ("test_type", key[1])] + list(extra.items())
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + "}"
+
+
+def _bucket(latencies_ns: Sequence[int]) -> Observation:
+    """Histogram increment for a batch of latency samples (ns)."""
+    if np is not None:
+        values = np.asarray(latencies_ns, dtype=np.int64)
+        indices = np.searchsorted(_BUCKETS_NS_ARRAY, values, side="left")
+        counts = np.bincount(indices, minlength=len(_BUCKETS_NS) + 1)
+        return counts.tolist(), int(values.sum()), len(values)
+    counts = [0] * (len(_BUCKETS_NS) + 1)
+    for latency in latencies_ns:
+        counts[bisect_left(_BUCKETS_NS, latency)] += 1
+    return counts, int(sum(latencies_ns)), len(latencies_ns)
+
+
+def _latency_samples(record: ResultRecord) -> List[Tuple[str, Any]]:
+    """(engine, latency samples in ns) pairs carried by a result record."""
+    if isinstance(record, LatencyResult):
+        return [(record.engine_name, record.latencies_ns)]
+    if isinstance(record, ComparisonResult):
+        return [(record.engine_name, record.baseline_latencies_ns),
+                (record.challenger_name, record.challenger_latencies_ns)]
+    return []
+
+
+def _sample_count(record: ResultRecord) -> int:
+    """Number of operations a record covers, for records without sample columns."""
+    if isinstance(record, SoakResult):
+        return record.samples  # Not the report count, which includes resumed segments
+    return getattr(record, "iterations", 0)
+
+
+class OpenMetricsExporterPlugin(TestplanPlugin):
+    """
+    Serves live run metrics on a local HTTP endpoint in OpenMetrics (or
+    Prometheus text) format, for scraping by a local Prometheus.
+
+    The executor hooks bucket the samples they receive (vectorized with
+    NumPy) and append only the small per-bucket counts to a deque. Pending
+    events are then folded into the per-engine/per-test counters,
+    throughput gauges and latency histograms by whoever gets the fold lock
+    first: the hook itself, or a scrape. A hook never waits for the lock,
+    so the measurement thread never waits on a scrape, and the deque only
+    holds the events of one scrape in progress. Strategies report progress
+    periodically (`on_test_progress`), so the metrics move during a test.
+    """
+
+    name = 'openmetrics_exporter'
+    runtime = RuntimeType.MAIN
+    cfg = OpenMetricsConfig
+
+    def __init__(self, **options):
+        options.setdefault('host', DEFAULT_HOST)
+        options.setdefault('port', int(os.environ.get(METRICS_PORT_ENV, 0)))
+        super().__init__(**options)
+        self._events: Deque[Tuple[Any, ...]] = deque()
+        self._metrics: Dict[Key, _EngineTestMetrics] = {}
+        self._fold_lock = threading.Lock()  # Serializes folds; hooks never block on it
+        # Samples of each running test already sent through on_test_progress
+        self._reported: Dict[Key, int] = {}
+        self._server = self._serve(self.cfg.host, self.cfg.port)
+
+    def _serve(self, host: str, port: int) -> ThreadingHTTPServer:
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                body = exporter.render(openmetrics).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE if openmetrics else PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep scrapes out of the test output
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="openmetrics-exporter", daemon=True).start()
+        return server
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def close(self) -> None:
+        """Stops the HTTP server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def on_test_start(self, engine_name: str, test_type: str) -> None:
+        """Called when a test starts."""
+        self._emit(("start", (engine_name, test_type), now_ns()))
+
+    def on_test_progress(self, engine_name: str, test_type: str, latencies_ns: Sequence[int]) -> None:
+        """Called periodically during a test; counts the new samples right away."""
+        key = (engine_name, test_type)
+        self._reported[key] = self._reported.get(key, 0) + len(latencies_ns)
+        self._emit(("progress", key, _bucket(latencies_ns)))
+
+    def on_test_complete(self, results: ResultRecord) -> None:
+        """Called when a test completes; counts the samples progress reports did not cover."""
+        key = (results.engine_name, results.test_type)
+        reported = self._reported.pop(key, 0)
+        observations: List[Tuple[Key, Observation]] = []
+        samples = 0
+        for engine_name, latencies in _latency_samples(results):
+            # Progress reports only cover the engine the test ran against
+            skip = reported if engine_name == results.engine_name else 0
+            try:
+                with open_samples(latencies) as view:
+                    samples += len(view)
+                    observations.append(((engine_name, results.test_type), _bucket(view[skip:])))
+                    del view
+            except FileNotFoundError:
+                continue  # Shared buffer already released
+        samples = samples or max(reported, _sample_count(results))
+        self._emit(("complete", key, observations, samples - reported, samples, now_ns()))
+
+    def _emit(self, event: Tuple[Any, ...]) -> None:
+        self._events.append(event)
+        # Fold now unless a scrape is folding; it drains this event too
+        if self._fold_lock.acquire(blocking=False):
+            try:
+                self._fold()
+            finally:
+                self._fold_lock.release()
+
+    def _metrics_for(self, key: Key) -> _EngineTestMetrics:
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = _EngineTestMetrics()
+        return metrics
+
+    @staticmethod
+    def _observe(metrics: _EngineTestMetrics, observation: Observation) -> None:
+        counts, sum_ns, count = observation
+        metrics.bucket_counts = [a + b for a, b in zip(metrics.bucket_counts, counts)]
+        metrics.latency_sum_ns += sum_ns
+        metrics.latency_count += count
+
+    def _fold(self) -> None:
+        """Drains pending events into the metrics (caller holds the fold lock)."""
+        events = self._events
+        while events:
+            event = events.popleft()
+            kind, key = event[0], event[1]
+            metrics = self._metrics_for(key)
+            if kind == "start":
+                metrics.started += 1
+                metrics.running_since.append(event[2])
+                continue
+            if kind == "progress":
+                self._observe(metrics, event[2])
+                metrics.samples += event[2][2]
+                continue
+
+            _, _, observations, new_samples, samples, timestamp = event
+            metrics.completed += 1
+            for observed_key, observation in observations:
+                self._observe(self._metrics_for(observed_key), observation)
+            metrics.samples += new_samples
+            if metrics.running_since:
+                duration_ns = timestamp - metrics.running_since.pop(0)
+                metrics.duration_ns += duration_ns
+                metrics.throughput = samples / (duration_ns / 1_000_000_000) if duration_ns else 0.0
+
+    def render(self, openmetrics: bool = True) -> str:
+        """
+        Current metrics in OpenMetrics text format (or Prometheus text format 0.0.4).
+
+        Returns:
+            str: Exposition text
+        """
+        with self._fold_lock:
+            self._fold()
+            snapshot = list(self._metrics.items())
+
+        lines: List[str] = []
+
+        def family(name: str, metric_type: str, help_text: str, samples: List[str]) -> None:
+            # OpenMetrics names counter families without the _total suffix
+            declared = name[:-len("_total")] if openmetrics and name.endswith("_total") else name
+            lines.append(f"# HELP {declared} {help_text}")
+            lines.append(f"# TYPE {declared} {metric_type}")
+            lines.extend(samples)
+
+        family("testpack_tests_started_total", "counter", "Tests started.",
+               [f"testpack_tests_started_total{_labels(k)} {m.started}" for k, m in snapshot])
+        family("testpack_tests_completed_total", "counter", "Tests completed.",
+               [f"testpack_tests_completed_total{_labels(k)} {m.completed}" for k, m in snapshot])
+        family("testpack_tests_running", "gauge", "Tests currently running.",
+               [f"testpack_tests_running{_labels(k)} {len(m.running_since)}" for k, m in snapshot])
+        family("testpack_samples_total", "counter", "Operations measured (counted as tests report progress).",
+               [f"testpack_samples_total{_labels(k)} {m.samples}" for k, m in snapshot])
+        family("testpack_test_duration_seconds_total", "counter", "Wall time spent in completed tests.",
+               [f"testpack_test_duration_seconds_total{_labels(k)} {m.duration_ns / 1e9}" for k, m in snapshot])
+        family("testpack_throughput_ops_per_second", "gauge", "Operations per second of the last completed test.",
+               [f"testpack_throughput_ops_per_second{_labels(k)} {m.throughput}" for k, m in snapshot])
+
+        histogram: List[str] = []
+        for key, metrics in snapshot:
+            if not metrics.latency_count:
+                continue
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS_S + ("+Inf",), metrics.bucket_counts):
+                cumulative += count
+                histogram.append(f"testpack_latency_seconds_bucket{_labels(key, le=str(bound))} {cumulative}")
+            histogram.append(f"testpack_latency_seconds_count{_labels(key)} {metrics.latency_count}")
+            histogram.append(f"testpack_latency_seconds_sum{_labels(key)} {metrics.latency_sum_ns / 1e9}")
+        family("testpack_latency_seconds", "histogram", "Per-operation latency.", histogram)
+
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def test_plan_result(self, result: TestReport):
+        """The endpoint keeps serving the final values until the process exits."""
+        print(f"OpenMetrics exporter: final metrics available at {self.url}")
+
+
+_EXPORTER: Optional[OpenMetricsExporterPlugin] = None
+
+
+def get_exporter() -> Optional[OpenMetricsExporterPlugin]:
+    """
+    The process-wide exporter when `TESTPACK_METRICS_PORT` is set, else None.
+    Created on first use, so only one server binds the port.
+    """
+    global _EXPORTER
+    if _EXPORTER is None and os.environ.get(METRICS_PORT_ENV) is not None:
+        _EXPORTER = OpenMetricsExporterPlugin()
+    return _EXPORTER
@@ -0,0 +1,126 @@
+import random
+from array import array
+import statistics
+from testplan.testing.result import Result
+from core.interfaces import ITestStrategy
+from core.results import ComparisonResult
+from core.significance import compare_paired_blocks
+from core.timing import get_calibration
+from engines.simple_engine_driver import SimpleEngineDriver
+from typing import Any, Dict, Optional
+
+class ComparisonStrategy(ITestStrategy):
+    """
+    Interleaved A/B strategy comparing two engine drivers within one test.
+
+    Orders are sent in short blocks alternating between the baseline and the
+    challenger, with the order inside each pair of blocks randomized, so
+    thermal state, background load and cache warmth affect both engines alike.
+    """
+
+    def __init__(
+        self,
+        block_size: int = 50,
+        confidence: float = 0.95,
+        bootstrap_resamples: int = 2000,
+        seed: Optional[int] = None
+    ):
+        self.block_size = block_size
+        self.confidence = confidence
+        self.bootstrap_resamples = bootstrap_resamples
+        self.seed = seed
+
+    @property
+    def test_type(self) -> str:
+        return "comparison"
+
+    def execute_test(
+        self,
+        engine: SimpleEngineDriver,
+        iterations: int,
+        challenger: SimpleEngineDriver = None
+    ) -> ComparisonResult:
+        """
+        Runs `iterations` orders on each of `engine` (baseline) and `challenger`.
+
+        Args:
+            engine: Baseline engine driver
+            iterations: Number of orders per engine
+            challenger: Engine driver compared against the baseline
+
+        Returns:
+            ComparisonResult with the raw samples of both engines (the statistics
+            are computed in `analyze_results`, outside the measured region)
+        """
+        if challenger is None:
+            raise ValueError("ComparisonStrategy requires a challenger driver")
+
+        rng = random.Random(self.seed)
+        samples: Dict[int, array] = {0: array("q"), 1: array("q")}
+        drivers = [engine, challenger]
+        block_order = array("B")
+
+        remaining = iterations
+        while remaining > 0:
+            block = min(self.block_size, remaining)
+            pair = [0, 1]
+            rng.shuffle(pair)
+            for idx in pair:
+                execute_trade = drivers[idx].execute_trade
+                collected = samples[idx]
+                for _ in range(block):
+                    collected.append(execute_trade("TEST/USD", 1))
+            block_order.extend(pair)
+            remaining -= block
+
+        return ComparisonResult(
+            engine_name=engine.name,
+            challenger_name=challenger.name,
+            baseline_latencies_ns=samples[0],
+            challenger_latencies_ns=samples[1],
+            block_size=self.block_size,
+            block_order=block_order,
+            clock_calibration=get_calibration()
+        )
+
+    def analyze_results(self, result_data: ComparisonResult, result: Result) -> Dict[str, Any]:
+        """
+        Compares both sample sets and reports the result.
+
+        Returns:
+            Dict[str, Any]: The comparison (see core.significance.compare_paired_blocks)
+        """
+        baseline, challenger = result_data.engine_name, result_data.challenger_name
+        comparison = compare_paired_blocks(
+            result_data.baseline_latencies_ns, result_data.challenger_latencies_ns,
+            result_data.block_size,
+            confidence=self.confidence,
+            resamples=self.bootstrap_resamples,
+            seed=self.seed
+        )
+
+        rows = [["engine", "median_ms", "p99_ms", "samples"]]
+        for name, samples in (
+            (baseline, result_data.baseline_latencies_ns),
+            (challenger, result_data.challenger_latencies_ns)
+        ):
+            latencies_ms = [l / 1_000_000 for l in samples]
+            rows.append([
+                name,
+                round(statistics.median(latencies_ms), 6),
+                round(statistics.quantiles(latencies_ms, n=100)[98], 6),
+                len(latencies_ms)
+            ])
+        result.table.log(rows, description=f"{baseline} vs {challenger} (interleaved)")
+
+        result.log(
+            f"Median difference ({challenger} - {baseline}): "
+            f"{comparison['median_diff'] / 1_000_000:.4f} ms, "
+            f"{comparison['confidence']:.0%} CI [{comparison['ci_low'] / 1_000_000:.4f}, "
+            f"{comparison['ci_high'] / 1_000_000:.4f}] ms, p={comparison['p_value']:.4g} "
+            f"({comparison['pairs']} block pairs)"
+        )
+        result.log(f"Verdict: {comparison['verdict']}")
+        result.dict.log(comparison, description="A/B comparison")
+        result.dict.log(result_data.clock_calibration.to_dict(), description="Clock calibration")
+        return comparison
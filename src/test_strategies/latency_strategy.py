@@ -1,36 +1,154 @@
 import statistics
+from array import array
 from testplan.testing.result import Result
+from core.attachments import attach_file, attach_record, attachment_file
 from core.interfaces import ITestStrategy
+from core.results import LatencyResult, LatencySummary
+from core.sample_tags import SampleTags, frame_to_table, latency_breakdown
+from core.shared_buffers import SharedSampleBuffer, is_shared_handle, open_samples, shared_memory_requested
+from core.test_executor import PROGRESS_INTERVAL, report_progress
+from core.timing import get_calibration, now_ns, overhead_subtraction_requested, subtract_overhead
+from performance_reporter import build_timeseries, write_html_report
 from engines.simple_engine_driver import SimpleEngineDriver 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
+
+# Order fields passed to `execute_trade`, with the value used when the order
+# mix does not vary that field. Other order mix dimensions only tag samples.
+ORDER_FIELDS: Dict[str, Any] = {"symbol": "TEST/USD", "size": 1, "order_type": "limit"}
 
 class LatencyStrategy(ITestStrategy):
     """Concrete strategy for measuring average latency."""
 
+    def __init__(
+        self,
+        subtract_timer_overhead: Optional[bool] = None,
+        order_mix: Dict[str, List[Any]] = None,
+        seed: Optional[int] = 0,
+        shared_memory: Optional[bool] = None
+    ):
+        # Remove the calibrated clock read cost from every sample
+        # (default: the TESTPACK_SUBTRACT_TIMER_OVERHEAD switch)
+        self.subtract_timer_overhead = (
+            overhead_subtraction_requested() if subtract_timer_overhead is None else subtract_timer_overhead
+        )
+        # Dimensions each sample is tagged with (default: symbol, size, order type)
+        if order_mix is not None:
+            empty = [dim for dim, values in order_mix.items() if not values]
+            if not order_mix or empty:
+                raise ValueError(f"order_mix needs at least one value per dimension, got none for {empty or 'all'}")
+        self.order_mix = order_mix
+        self.seed = seed
+        # Write samples into shared memory and return a handle instead of a list
+        # (default: the TESTPACK_SHARED_MEMORY switch)
+        self.shared_memory = shared_memory_requested() if shared_memory is None else shared_memory
+
+    @property
     def test_type(self) -> str:
         return "latency"
 
-    def execute_test(self, engine: SimpleEngineDriver, iterations: int) -> Dict[str, Any]:
-        latencies_ns = []
-        for _ in range(iterations):
-            latency = engine.execute_trade("TEST/USD", 1)
-            latencies_ns.append(latency)
-            
-        return {
-            "test_type": "latency",
-            "latencies_ns": latencies_ns,
-            "engine_name": engine.name
-        }
-
-    def analyze_results(self, result_data: Dict[str, Any], result: Result):
-        latencies_ms = [l / 1_000_000 for l in result_data["latencies_ns"]]
+    def generate_orders(self, iterations: int) -> Tuple[SampleTags, List[Tuple[Any, ...]]]:
+        """
+        Draws the tags of every sample and builds the (symbol, size, order_type)
+        order sent for each, filling fields the order mix does not vary from ORDER_FIELDS.
+        """
+        tags = SampleTags.generate(iterations, self.order_mix, self.seed)
+        columns = [
+            tags.values(name) if name in tags.categories else [default] * iterations
+            for name, default in ORDER_FIELDS.items()
+        ]
+        return tags, list(zip(*columns))
+
+    @staticmethod
+    def run_orders(engine: SimpleEngineDriver, orders: List[Tuple[Any, ...]], samples, timestamps, offset: int = 0) -> None:
+        """
+        The measurement loop: sends every order, storing its send time and
+        latency (ns) from index `offset` on.
+        """
+        execute_trade = engine.execute_trade
+        for i, (symbol, size, order_type) in enumerate(orders, offset):
+            # One clock read + store (~130 ns), outside the interval the engine times
+            timestamps[i] = now_ns()
+            samples[i] = execute_trade(symbol, size, order_type)
+
+    def execute_test(self, engine: SimpleEngineDriver, iterations: int) -> LatencyResult:
+        tags, orders = self.generate_orders(iterations)
+
+        buffer = SharedSampleBuffer.create(iterations) if self.shared_memory else None
+        ts_buffer = SharedSampleBuffer.create(iterations) if self.shared_memory else None
+        samples = buffer.raw_view() if buffer else array("q", bytes(8 * iterations))
+        # Send time of every order, for the time-series report
+        timestamps = ts_buffer.raw_view() if ts_buffer else array("q", bytes(8 * iterations))
+
+        # Measure in chunks so live plugins see progress during long runs
+        calibration = get_calibration()
+        for start in range(0, iterations, PROGRESS_INTERVAL):
+            end = min(start + PROGRESS_INTERVAL, iterations)
+            self.run_orders(engine, orders[start:end], samples, timestamps, start)
+            if self.subtract_timer_overhead:
+                samples[start:end] = array("q", subtract_overhead(samples[start:end], calibration))
+            report_progress(engine.name, self.test_type, samples[start:end])
+
+        if buffer:
+            latencies_ns, timestamps_ns = buffer.handle, ts_buffer.handle
+            del samples, timestamps
+            buffer.close()
+            ts_buffer.close()
+        else:
+            latencies_ns, timestamps_ns = samples, timestamps
+
+        return LatencyResult(
+            engine_name=engine.name,
+            latencies_ns=latencies_ns,
+            timestamps_ns=timestamps_ns,
+            sample_tags=tags,
+            clock_calibration=calibration,
+            timer_overhead_subtracted=self.subtract_timer_overhead
+        )
+
+    def analyze_results(self, result_data: LatencyResult, result: Result):
+        with open_samples(result_data.latencies_ns) as latencies_ns:
+            latencies_ms = [l / 1_000_000 for l in latencies_ns]
+            tags = result_data.sample_tags
+            # Copy into the frame so it does not pin a shared buffer mapping
+            samples_frame = tags.to_frame(array("q", latencies_ns))
+            with open_samples(result_data.timestamps_ns) as timestamps_ns:
+                timeseries = build_timeseries(timestamps_ns, latencies_ns)
+                del timestamps_ns
+            del latencies_ns
         avg_latency = statistics.mean(latencies_ms)
         p99_latency = statistics.quantiles(latencies_ms, n=100)[98] # 99th percentile
 
         # Use Testplan assertions for reporting and pass/fail criteria
         result.log(f"Avg Latency: {avg_latency:.3f} ms")
         result.log(f"P99 Latency: {p99_latency:.3f} ms")
-        
+        result.dict.log(result_data.clock_calibration.to_dict(), description="Clock calibration")
+
+        # Per-dimension breakdown (symbol, size, order type)
+        breakdown = latency_breakdown(samples_frame, list(tags.categories))
+        breakdown_tables = {dim: frame_to_table(frame) for dim, frame in breakdown.items()}
+        for dim, table in breakdown_tables.items():
+            result.table.log(table, description=f"Latency by {dim}")
+
+        # Data for the reporter plugins, bounded in size regardless of the
+        # iteration count: shared buffers travel as handles (read zero-copy),
+        # otherwise only a summary and the downsampled series are attached
+        if is_shared_handle(result_data.latencies_ns):
+            attach_record(result, "LatencyRawData", {"latency_data_ns": result_data.latencies_ns})
+        else:
+            attach_record(result, "LatencyRawData", LatencySummary(
+                data_points=len(latencies_ms),
+                min_ms=min(latencies_ms),
+                max_ms=max(latencies_ms),
+                avg_ms=avg_latency
+            ))
+        attach_record(result, "LatencyBreakdown", breakdown_tables)
+        attach_record(result, "LatencyTimeSeries", timeseries)
+
+        report_name = f"{result_data.engine_name}_latency"
+        report_path = attachment_file(report_name, ".html")
+        write_html_report({report_name: timeseries}, report_path, title=f"{report_name} time series")
+        attach_file(result, report_path, "LatencyTimeSeriesReport")
+
         # Performance Assertion (Success Criteria)
-        result.less(avg_latency, 1.0, description=f"Avg Latency under 1.0ms for {result_data['engine_name']}")
-        result.less(p99_latency, 1.5, description=f"P99 Latency under 1.5ms for {result_data['engine_name']}")
+        result.less(avg_latency, 1.0, description=f"Avg Latency under 1.0ms for {result_data.engine_name}")
+        result.less(p99_latency, 1.5, description=f"P99 Latency under 1.5ms for {result_data.engine_name}")
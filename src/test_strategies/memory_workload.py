@@ -0,0 +1,156 @@
+import gc
+import os
+import random
+import tracemalloc
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from core.timing import now_ns
+
+
+@dataclass
+class MemoryWorkloadConfig:
+    """Shape of one allocator workload round."""
+    small_objects: int = 2_000                                # Many small objects
+    small_size: int = 64
+    mixed_sizes: Tuple[int, ...] = (16, 128, 1_024, 16_384)  # Fragmentation-inducing mix
+    mixed_allocations: int = 500
+    large_buffer_size: int = 1024 * 1024                      # Large buffer churn
+    large_buffers: int = 2
+    long_lived_ratio: float = 0.05                            # Share of objects surviving the round
+    max_long_lived: int = 20_000                              # Cap on retained objects
+    traced_rounds: int = 20                                   # Rounds re-run under tracemalloc
+
+
+def rss_bytes() -> Optional[int]:
+    """Resident set size of this process from /proc (None where unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemoryWorkload:
+    """
+    Configurable allocator workload for memory stress.
+
+    Each round allocates many small objects, a shuffled mix of sizes of which
+    every other one is freed (leaving holes), churns a few large buffers, and
+    promotes a share of the objects to a long-lived pool that survives
+    across rounds. Rounds are timed without tracing; memory accounting is
+    done afterwards by `trace`, so tracemalloc does not skew the timings.
+    """
+
+    def __init__(self, config: MemoryWorkloadConfig = None, seed: Optional[int] = 0):
+        self.config = config or MemoryWorkloadConfig()
+        self._rng = random.Random(seed)
+        self._long_lived: Deque[bytearray] = deque()
+        self.live_bytes = 0
+        self.allocations = 0
+        self.allocated_bytes = 0
+        self.elapsed_ns = 0
+        self._rss_start: Optional[int] = None
+
+    def start(self) -> None:
+        gc.collect()
+        self._rss_start = rss_bytes()
+
+    def run_round(self) -> int:
+        """
+        Runs one workload round.
+
+        Returns:
+            int: Duration of the round in nanoseconds
+        """
+        cfg = self.config
+        start = now_ns()
+
+        short_lived = [bytearray(cfg.small_size) for _ in range(cfg.small_objects)]
+        mixed_sizes = self._rng.choices(cfg.mixed_sizes, k=cfg.mixed_allocations)
+        mixed = [bytearray(size) for size in mixed_sizes]
+        del mixed[::2]  # Punch holes between the survivors
+        for _ in range(cfg.large_buffers):
+            buffer = bytearray(cfg.large_buffer_size)
+            buffer[-1] = 1
+            del buffer
+
+        # Promote a share of both pools to long-lived objects
+        promoted = short_lived[:int(len(short_lived) * cfg.long_lived_ratio)]
+        promoted += mixed[:int(len(mixed) * cfg.long_lived_ratio)]
+        for obj in promoted:
+            self._long_lived.append(obj)
+            self.live_bytes += len(obj)
+        while len(self._long_lived) > cfg.max_long_lived:
+            self.live_bytes -= len(self._long_lived.popleft())
+        del short_lived, mixed, promoted
+
+        elapsed = now_ns() - start
+        self.elapsed_ns += elapsed
+        self.allocations += cfg.small_objects + cfg.mixed_allocations + cfg.large_buffers
+        self.allocated_bytes += (
+            cfg.small_objects * cfg.small_size
+            + sum(mixed_sizes)
+            + cfg.large_buffers * cfg.large_buffer_size
+        )
+        return elapsed
+
+    def trace(self, rounds: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Re-runs `rounds` rounds under tracemalloc (call after `report`, as
+        these rounds also count towards the totals).
+
+        Returns:
+            Dict[str, Any]: Peak/current traced memory and the top allocation sites
+        """
+        rounds = rounds if rounds is not None else self.config.traced_rounds
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            for _ in range(rounds):
+                self.run_round()
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        # Leave out tracemalloc's own bookkeeping
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        before, after = before.filter_traces(ignore), after.filter_traces(ignore)
+
+        top: List[Dict[str, Any]] = [
+            {"site": str(stat.traceback[0]), "size_diff_kb": stat.size_diff / 1024, "count_diff": stat.count_diff}
+            for stat in after.compare_to(before, "lineno")[:5]
+        ]
+        return {"traced_rounds": rounds, "traced_current_kb": current / 1024,
+                "traced_peak_kb": peak / 1024, "top_allocation_sites": top}
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Allocation throughput, RSS growth and a fragmentation estimate for
+        all timed rounds so far.
+
+        Fragmentation is the share of RSS growth that is not backed by live
+        long-lived objects (0 = all growth is live data).
+        """
+        gc.collect()
+        rss_end = rss_bytes()
+        seconds = self.elapsed_ns / 1_000_000_000 or float("nan")
+        rss_growth = rss_end - self._rss_start if rss_end is not None and self._rss_start is not None else None
+        fragmentation = None
+        if rss_growth and rss_growth > 0:
+            fragmentation = max(0.0, min(1.0, 1 - self.live_bytes / rss_growth))
+        return {
+            "config": asdict(self.config),
+            "allocations": self.allocations,
+            "allocations_per_s": self.allocations / seconds,
+            "allocated_mb_per_s": self.allocated_bytes / (1024 * 1024) / seconds,
+            "long_lived_objects": len(self._long_lived),
+            "live_kb": self.live_bytes / 1024,
+            "rss_growth_kb": rss_growth / 1024 if rss_growth is not None else None,
+            "fragmentation": fragmentation,
+        }
+
+    def release(self) -> None:
+        """Drops the long-lived pool."""
+        self._long_lived.clear()
+        self.live_bytes = 0
@@ -0,0 +1,119 @@
+import glob
+import os
+from array import array
+from testplan.testing.result import Result
+from core.attachments import attach_record
+from core.interfaces import ITestStrategy
+from core.results import SoakResult
+from core.soak import SoakRecorder
+from core.test_executor import PROGRESS_INTERVAL, report_progress
+from core.timing import now_ns
+from engines.simple_engine_driver import SimpleEngineDriver
+from typing import Optional
+
+# Overrides for long runs without code changes (e.g. in CI soak jobs)
+SOAK_DURATION_ENV = "TESTPACK_SOAK_DURATION_S"
+SOAK_DIR_ENV = "TESTPACK_SOAK_DIR"
+
+class SoakStrategy(ITestStrategy):
+    """
+    Long-running strategy with bounded memory.
+
+    Trades are sent until `duration_s` of recorded time has elapsed; samples
+    only live in the current segment histogram and are flushed to disk every
+    `segment_interval_s`. Every run gets its own `run-NNNN` subdirectory per
+    engine: running again resumes the latest run if it was interrupted (only
+    for the remaining duration), and starts a new run once it completed.
+
+    Not cacheable: the result depends on the segments on disk, which the
+    cache key does not cover, so a cached result would replay an old soak.
+    """
+
+    cacheable = False
+
+    def __init__(
+        self,
+        duration_s: Optional[float] = None,
+        segment_interval_s: float = 60.0,
+        segment_dir: Optional[str] = None
+    ):
+        self.duration_s = duration_s if duration_s is not None else float(
+            os.environ.get(SOAK_DURATION_ENV, 24 * 3600)
+        )
+        self.segment_interval_s = segment_interval_s
+        self.segment_dir = segment_dir or os.environ.get(SOAK_DIR_ENV, ".testpack_soak")
+
+    @property
+    def test_type(self) -> str:
+        return "soak"
+
+    @staticmethod
+    def run_dir(engine_dir: str) -> str:
+        """The latest run under `engine_dir` if it is incomplete, else a new run directory."""
+        runs = sorted(glob.glob(os.path.join(engine_dir, "run-*")))
+        if runs and not SoakRecorder.is_complete(runs[-1]):
+            return runs[-1]
+        next_id = int(os.path.basename(runs[-1]).split("-")[1]) + 1 if runs else 0
+        return os.path.join(engine_dir, f"run-{next_id:04d}")
+
+    def execute_test(self, engine: SimpleEngineDriver, iterations: int) -> SoakResult:
+        """
+        Runs the soak against `engine`.
+
+        Args:
+            engine: Engine driver to test
+            iterations: Unused; the soak is bounded by duration instead
+
+        Returns:
+            SoakResult with the report built from the on-disk segments
+        """
+        segment_dir = self.run_dir(os.path.join(self.segment_dir, engine.name))
+        recorder = SoakRecorder(segment_dir, self.segment_interval_s)
+        remaining_ns = int(self.duration_s * 1_000_000_000) - recorder.recorded_duration_ns
+
+        record = recorder.record
+        execute_trade = engine.execute_trade
+        # Latencies since the last progress report (the histograms only keep bucket counts)
+        pending = array("q", bytes(8 * PROGRESS_INTERVAL))
+        filled = measured = 0
+        end = now_ns() + remaining_ns
+        timestamp = now_ns()
+        while timestamp < end:
+            latency = execute_trade("TEST/USD", 1)
+            record(timestamp, latency)
+            pending[filled] = latency
+            filled += 1
+            if filled == PROGRESS_INTERVAL:
+                report_progress(engine.name, self.test_type, pending)
+                measured += filled
+                filled = 0
+            timestamp = now_ns()
+        if filled:
+            report_progress(engine.name, self.test_type, pending[:filled])
+            measured += filled
+
+        return SoakResult(
+            engine_name=engine.name,
+            segment_dir=segment_dir,
+            resumed_segments=recorder.resumed_segments,
+            samples=measured,
+            report=recorder.finalize()
+        )
+
+    def analyze_results(self, result_data: SoakResult, result: Result):
+        report = result_data.report
+        summary = report["summary"]
+        result.log(
+            f"Soak: {summary['count']} trades over {report['duration_s'] / 3600:.2f} h "
+            f"in {report['segments']} segments (resumed from {result_data.resumed_segments})"
+        )
+
+        columns = ["bucket", "count", "avg", "p50", "p99", "max"]
+        for granularity in ("hourly", "daily"):
+            rows = [[row[c] if c in ("bucket", "count") else round(row[c], 6) for c in columns]
+                    for row in report[granularity] if row["count"]]
+            result.table.log([columns] + rows, description=f"Soak {granularity} rollups (ms)")
+        attach_record(result, "SoakReport", report)
+
+        if summary["count"]:
+            result.less(summary["p99"], 1.5, description=f"Soak P99 under 1.5ms for {result_data.engine_name}")
@@ -1,16 +1,29 @@
+from array import array
 from core.interfaces import ITestStrategy, IEngine
-from typing import Dict, Any, List
-import time
+from core.results import StressMeasurement, StressResult
+from core.shared_buffers import SharedSampleBuffer, shared_memory_requested
+from core.timing import get_calibration, now_ns
+from test_strategies.memory_workload import MemoryWorkload, MemoryWorkloadConfig
+from typing import Dict, Optional
 import random
 
+STRESS_TYPES = ("cpu_stress_ms", "memory_stress_ms", "io_stress_ms")
+
 class StressStrategy(ITestStrategy):
     """Strategy for performing stress tests on engines."""
 
+    def __init__(self, shared_memory: Optional[bool] = None, memory_workload: MemoryWorkloadConfig = None):
+        # Write measurements into shared memory and return handles instead of lists
+        # (default: the TESTPACK_SHARED_MEMORY switch)
+        self.shared_memory = shared_memory_requested() if shared_memory is None else shared_memory
+        # Allocator workload run by the memory stress step
+        self.memory_workload = memory_workload or MemoryWorkloadConfig()
+
     @property
     def test_type(self) -> str:
         return "stress"
 
-    def execute_test(self, engine: IEngine, iterations: int) -> Dict[str, Any]:
+    def execute_test(self, engine: IEngine, iterations: int) -> StressResult:
         """
         Executes stress tests using different stress types (CPU, Memory, IO).
         
@@ -19,61 +32,90 @@ class StressStrategy(ITestStrategy):
             iterations: Number of stress test iterations
             
         Returns:
-            Dictionary containing stress test results
+            StressResult with one measurement per stress type
         """
-        results: Dict[str, List[float]] = {
-            "cpu_stress_ms": [],
-            "memory_stress_ms": [],
-            "io_stress_ms": []
-        }
+        buffers: Dict[str, SharedSampleBuffer] = {}
+        if self.shared_memory:
+            buffers = {name: SharedSampleBuffer.create(iterations, "d") for name in STRESS_TYPES}
+            results = {name: buffer.raw_view() for name, buffer in buffers.items()}
+        else:
+            results: Dict[str, array] = {name: array("d", bytes(8 * iterations)) for name in STRESS_TYPES}
         
         # Get engine name safely
         engine_name = getattr(engine, 'name', str(engine))
+
+        workload = MemoryWorkload(self.memory_workload)
+        workload.start()
         
-        for _ in range(iterations):
+        for i in range(iterations):
             # CPU Stress
-            start_time = time.time()
+            start_time = now_ns()
             for _ in range(10000):  # Reduced for testing
                 _ = random.random() ** 2
-            results["cpu_stress_ms"].append((time.time() - start_time) * 1000)
+            results["cpu_stress_ms"][i] = (now_ns() - start_time) / 1_000_000
             
-            # Memory Stress
-            start_time = time.time()
-            memory_block = ['x' * 1024 * 1024]  # Allocate 1MB
-            results["memory_stress_ms"].append((time.time() - start_time) * 1000)
-            del memory_block  # Clean up
+            # Memory Stress (small objects, mixed sizes, large buffer churn, long-lived pool)
+            results["memory_stress_ms"][i] = workload.run_round() / 1_000_000
             
             # IO Stress
-            start_time = time.time()
+            start_time = now_ns()
             engine.execute_operation(operation="write", size_bytes=1024*1024)
-            results["io_stress_ms"].append((time.time() - start_time) * 1000)
+            results["io_stress_ms"][i] = (now_ns() - start_time) / 1_000_000
             
+        # Allocator behaviour over the timed rounds, then tracemalloc accounting
+        memory_report = workload.report()
+        memory_report.update(workload.trace())
+        workload.release()
+
         # Calculate statistics for each stress type
-        final_results = {}
+        stress_measurements: Dict[str, StressMeasurement] = {}
         for stress_type, measurements in results.items():
-            final_results[stress_type] = {
-                "min_ms": min(measurements),
-                "max_ms": max(measurements),
-                "avg_ms": sum(measurements) / len(measurements),
-                "raw_data_ms": measurements
-            }
-            
-        # Attach raw data for plugins to process
-        final_results["stress_raw_data"] = {
-            "iterations": iterations,
-            "measurements": results
-        }
-        
-        return final_results
+            stress_measurements[stress_type] = StressMeasurement(
+                min_ms=min(measurements),
+                max_ms=max(measurements),
+                avg_ms=sum(measurements) / len(measurements),
+                raw_data_ms=buffers[stress_type].handle if buffers else measurements
+            )
+
+        if buffers:
+            # Only the handles travel back; views must be released before closing
+            del measurements, results
+            for buffer in buffers.values():
+                buffer.close()
+
+        return StressResult(
+            engine_name=engine_name,
+            iterations=iterations,
+            **stress_measurements,
+            memory_workload=memory_report,
+            clock_calibration=get_calibration()
+        )
 
-    def analyze_results(self, result_data, testplan_result):
+    def analyze_results(self, result_data: StressResult, testplan_result):
         # return super().analyze_results(result_data, testplan_result)
-        cpu_avg = result_data["cpu_stress_ms"]["avg_ms"]
-        memory_avg = result_data["memory_stress_ms"]["avg_ms"]
-        io_avg = result_data["io_stress_ms"]["avg_ms"]
+        cpu_avg = result_data.cpu_stress_ms.avg_ms
+        memory_avg = result_data.memory_stress_ms.avg_ms
+        io_avg = result_data.io_stress_ms.avg_ms
         testplan_result.log(f"Avg CPU Stress Time: {cpu_avg:.3f} ms")
         testplan_result.log(f"Avg Memory Stress Time: {memory_avg:.3f} ms")
         testplan_result.log(f"Avg IO Stress Time: {io_avg:.3f} ms")
+        memory_report = result_data.memory_workload
+        testplan_result.log(
+            f"Allocation throughput: {memory_report['allocations_per_s']:,.0f} allocs/s, "
+            f"{memory_report['allocated_mb_per_s']:,.1f} MB/s; "
+            f"peak traced {memory_report['traced_peak_kb']:,.0f} KB"
+        )
+        testplan_result.dict.log(
+            {k: v for k, v in memory_report.items() if k not in ("config", "top_allocation_sites")},
+            description="Memory workload"
+        )
+        testplan_result.table.log(
+            [["site", "size_diff_kb", "count_diff"]]
+            + [[row["site"], round(row["size_diff_kb"], 1), row["count_diff"]]
+               for row in memory_report["top_allocation_sites"]],
+            description="Top allocation sites (tracemalloc)"
+        )
+        testplan_result.dict.log(result_data.clock_calibration.to_dict(), description="Clock calibration")
         # Example assertions
         testplan_result.less(cpu_avg, 50.0, description="Avg CPU Stress under 50ms")
         testplan_result.less(memory_avg, 20.0, description="Avg Memory Stress under 20ms")
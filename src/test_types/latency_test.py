@@ -1,29 +1,54 @@
+from array import array
 from core.interfaces import ITestStrategy, IEngine
-import time
-from typing import Dict, Any
+from core.results import AverageLatencyResult
+from core.timing import get_calibration, now_ns, overhead_subtraction_requested, subtract_overhead
+from testplan.testing.result import Result
+from typing import Optional
+
+# Built once instead of per trade
+ORDER = {"symbol": "BTC/USD", "amount": 1}
 
 class LatencyTest(ITestStrategy):
+    def __init__(self, subtract_timer_overhead: Optional[bool] = None):
+        # Default: the TESTPACK_SUBTRACT_TIMER_OVERHEAD switch
+        self.subtract_timer_overhead = (
+            overhead_subtraction_requested() if subtract_timer_overhead is None else subtract_timer_overhead
+        )
+
     @property
     def test_type(self) -> str:
         return "latency"
 
-    def execute_test(self, engine: IEngine, iterations: int = 1000) -> Dict[str, Any]:
+    def execute_test(self, engine: IEngine, iterations: int = 1000) -> AverageLatencyResult:
         total_time = 0
-        latencies = []
-        for _ in range(iterations):
-            start = time.perf_counter_ns()
-            engine.execute_trade({"symbol": "BTC/USD", "amount": 1})
-            end = time.perf_counter_ns()
+        latencies = array("q", bytes(8 * iterations))
+        execute_trade = engine.execute_trade
+        for i in range(iterations):
+            start = now_ns()
+            execute_trade(ORDER)
+            end = now_ns()
             latency_ns = end - start
-            latencies.append(latency_ns)
+            latencies[i] = latency_ns
             total_time += latency_ns
-            
+
+        calibration = get_calibration()
+        if self.subtract_timer_overhead:
+            total_time = sum(subtract_overhead(latencies, calibration))
+
         avg_latency_ms = (total_time / iterations) / 1_000_000
         
-        return {
-            "test_type": self.test_type,
-            "engine": engine.name,
-            "iterations": iterations,
-            "avg_latency_ms": avg_latency_ms,
-            # For detailed analysis, you might return the full latencies list
-        }
+        return AverageLatencyResult(
+            engine_name=engine.name,
+            iterations=iterations,
+            avg_latency_ms=avg_latency_ms,
+            clock_calibration=calibration,
+            # For detailed analysis, you might return the full latencies column
+        )
+
+    def analyze_results(self, result_data: AverageLatencyResult, result: Result):
+        result.log(f"Avg Latency: {result_data.avg_latency_ms:.3f} ms")
+        result.dict.log(result_data.clock_calibration.to_dict(), description="Clock calibration")
+        result.less(
+            result_data.avg_latency_ms, 1.0,
+            description=f"Avg Latency under 1.0ms for {result_data.engine_name}"
+        )
@@ -0,0 +1,30 @@
+import os
+from array import array
+from testplan.testing.result import Result
+from core import attachments
+from core.attachments import attach_record, get_attachment_data
+
+
+def test_scratch_copy_replaces_our_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(attachments, "_RUN_DIR", str(tmp_path / "run"))
+    os.makedirs(tmp_path / "run")
+    scratch = tmp_path / "scratch"
+    scratch.mkdir()
+    result = Result(_scratch=str(scratch))
+
+    path = attach_record(result, "Samples", {"latency_data_ns": array("q", [1, 2, 3])})
+
+    assert os.path.dirname(path) == str(scratch)
+    assert os.listdir(tmp_path / "run") == []
+    assert get_attachment_data(result, "Samples") == {"latency_data_ns": array("q", [1, 2, 3])}
+
+
+def test_files_without_scratch_stay_in_the_attachments_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(attachments, "_RUN_DIR", None)
+    monkeypatch.setenv(attachments.ATTACHMENTS_DIR_ENV, str(tmp_path))
+    result = Result()
+
+    path = attach_record(result, "Breakdown", {"rows": [1, 2]})
+
+    assert os.path.dirname(path) == str(tmp_path)
+    assert get_attachment_data(result, "Breakdown") == {"rows": [1, 2]}
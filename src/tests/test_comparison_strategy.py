@@ -0,0 +1,60 @@
+import pytest
+from testplan.testing.result import Result
+from engines.simple_engine_driver import SimpleEngineDriver
+from test_strategies.comparison_strategy import ComparisonStrategy
+
+
+class LoggingDriver(SimpleEngineDriver):
+    """Driver with a fixed latency that logs which engine served each order."""
+
+    def __init__(self, engine_name, latency_ns, log):
+        super().__init__(name=f"driver_{engine_name}", engine_name=engine_name)
+        self.latency_ns = latency_ns
+        self.log = log
+
+    def execute_trade(self, symbol, volume, order_type="limit"):
+        self.log.append(self.name)
+        return self.latency_ns
+
+
+def _drivers(log):
+    return LoggingDriver("Alpha", 1_000, log), LoggingDriver("Beta", 2_000, log)
+
+
+def test_blocks_alternate_in_randomized_pairs():
+    log = []
+    baseline, challenger = _drivers(log)
+
+    results = ComparisonStrategy(block_size=50, seed=3).execute_test(baseline, 120, challenger=challenger)
+
+    assert list(results.baseline_latencies_ns) == [1_000] * 120
+    assert list(results.challenger_latencies_ns) == [2_000] * 120
+    # Blocks of 50, 50 and a partial 20, each pair run in random order
+    order = list(results.block_order)
+    assert len(order) == 6
+    assert all(sorted(order[i:i + 2]) == [0, 1] for i in range(0, 6, 2))
+    names = [baseline.name, challenger.name]
+    expected = [names[idx] for i, idx in enumerate(order) for _ in range(50 if i < 4 else 20)]
+    assert log == expected
+
+
+def test_a_challenger_is_required():
+    baseline, _ = _drivers([])
+
+    with pytest.raises(ValueError):
+        ComparisonStrategy().execute_test(baseline, 10)
+
+
+def test_analysis_counts_block_pairs():
+    baseline, challenger = _drivers([])
+    strategy = ComparisonStrategy(block_size=10, bootstrap_resamples=200, seed=1)
+
+    few = strategy.analyze_results(strategy.execute_test(baseline, 30, challenger=challenger), Result())
+    many = strategy.analyze_results(strategy.execute_test(baseline, 100, challenger=challenger), Result())
+
+    # 3 pairs can't reach p < 0.05 however consistent they are (2 of 8 sign patterns)
+    assert few["pairs"] == 3 and few["p_value"] == 0.25
+    assert few["verdict"] == "no significant difference"
+    assert many["pairs"] == 10
+    assert many["verdict"] == "candidate slower"
+    assert many["median_diff"] == 1_000
@@ -0,0 +1,22 @@
+import os
+import pytest
+from benchmarks.framework_overhead import (
+    RUN_BENCHMARKS_ENV, check_regressions, find_regressions, load_baseline
+)
+
+
+def test_hot_path_regressions_are_caught():
+    baseline = {"latency_strategy_iteration_ns": 659.0, "rich_print_ns": 300_000.0}
+
+    assert find_regressions({"latency_strategy_iteration_ns": 886.0}, baseline)
+    assert not find_regressions({"latency_strategy_iteration_ns": 700.0}, baseline)
+    # Coarse metrics keep the loose tolerance
+    assert not find_regressions({"rich_print_ns": 400_000.0}, baseline)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not os.environ.get(RUN_BENCHMARKS_ENV), reason=f"set {RUN_BENCHMARKS_ENV}=1 to run")
+def test_no_framework_overhead_regressions():
+    _, regressions = check_regressions(load_baseline()["metrics"])
+
+    assert not regressions, "\n".join(regressions)
@@ -0,0 +1,62 @@
+import pytest
+from core import timing
+from core.timing import ClockCalibration
+from engines.simple_engine_driver import SimpleEngineDriver
+from test_strategies import latency_strategy
+from test_strategies.latency_strategy import LatencyStrategy
+from test_types.latency_test import LatencyTest
+
+
+class RecordingDriver(SimpleEngineDriver):
+    """Driver that records the orders it receives instead of sleeping."""
+
+    def __init__(self):
+        super().__init__(name="driver_Recording", engine_name="Recording")
+        self.orders = []
+
+    def execute_trade(self, symbol, volume, order_type="limit"):
+        self.orders.append((symbol, volume, order_type))
+        return 1_000
+
+
+def test_partial_order_mix_fills_default_fields():
+    driver = RecordingDriver()
+    strategy = LatencyStrategy(order_mix={"symbol": ["BTC/USD", "ETH/USD"], "venue": ["A", "B"]})
+
+    results = strategy.execute_test(driver, 50)
+
+    assert {order[0] for order in driver.orders} <= {"BTC/USD", "ETH/USD"}
+    assert {order[1:] for order in driver.orders} == {(1, "limit")}
+    assert set(results.sample_tags.categories) == {"symbol", "venue"}
+
+
+@pytest.mark.parametrize("order_mix", [{}, {"symbol": []}])
+def test_empty_order_mix_is_rejected(order_mix):
+    with pytest.raises(ValueError):
+        LatencyStrategy(order_mix=order_mix)
+
+
+def test_timer_overhead_is_subtracted_from_every_sample(monkeypatch):
+    calibration = ClockCalibration(
+        clock="perf_counter", reported_resolution_ns=1.0, resolution_ns=1.0,
+        read_overhead_ns=130.0, monotonic=True, samples=1,
+    )
+    monkeypatch.setattr(latency_strategy, "get_calibration", lambda: calibration)
+
+    plain = LatencyStrategy(subtract_timer_overhead=False).execute_test(RecordingDriver(), 25)
+    subtracted = LatencyStrategy(subtract_timer_overhead=True).execute_test(RecordingDriver(), 25)
+
+    assert list(plain.latencies_ns) == [1_000] * 25
+    assert list(subtracted.latencies_ns) == [870] * 25
+    assert subtracted.timer_overhead_subtracted and not plain.timer_overhead_subtracted
+
+
+def test_timer_overhead_switch(monkeypatch):
+    monkeypatch.setenv(timing.SUBTRACT_OVERHEAD_ENV, "1")
+    assert LatencyStrategy().subtract_timer_overhead
+    assert LatencyTest().subtract_timer_overhead
+    assert not LatencyStrategy(subtract_timer_overhead=False).subtract_timer_overhead
+
+    monkeypatch.delenv(timing.SUBTRACT_OVERHEAD_ENV)
+    assert not LatencyStrategy().subtract_timer_overhead
+    assert not LatencyTest().subtract_timer_overhead
@@ -0,0 +1,45 @@
+import random
+from test_strategies.memory_workload import MemoryWorkload, MemoryWorkloadConfig
+
+SMALL = MemoryWorkloadConfig(
+    small_objects=100, small_size=32, mixed_sizes=(16, 4_096), mixed_allocations=40,
+    large_buffer_size=64 * 1024, large_buffers=1, long_lived_ratio=0.1, max_long_lived=30,
+    traced_rounds=2,
+)
+
+
+def test_allocated_bytes_counts_the_sizes_drawn():
+    workload = MemoryWorkload(SMALL, seed=5)
+    workload.start()
+    for _ in range(3):
+        workload.run_round()
+
+    # Same seed, same draws as the workload's own RNG
+    rng = random.Random(5)
+    mixed = sum(sum(rng.choices(SMALL.mixed_sizes, k=SMALL.mixed_allocations)) for _ in range(3))
+    expected = 3 * (SMALL.small_objects * SMALL.small_size + SMALL.large_buffers * SMALL.large_buffer_size) + mixed
+    assert workload.allocated_bytes == expected
+    assert workload.allocations == 3 * (SMALL.small_objects + SMALL.mixed_allocations + SMALL.large_buffers)
+
+
+def test_report_trace_and_release():
+    workload = MemoryWorkload(SMALL)
+    workload.start()
+    for _ in range(5):
+        workload.run_round()
+
+    report = workload.report()
+    assert report["config"]["mixed_allocations"] == SMALL.mixed_allocations
+    assert report["allocations_per_s"] > 0
+    assert report["long_lived_objects"] == SMALL.max_long_lived  # 12 promoted per round, capped
+    assert report["live_kb"] > 0
+    assert report["fragmentation"] is None or 0.0 <= report["fragmentation"] <= 1.0
+
+    traced = workload.trace()
+    assert traced["traced_rounds"] == SMALL.traced_rounds
+    assert traced["traced_peak_kb"] >= traced["traced_current_kb"] >= 0
+    assert traced["top_allocation_sites"]
+
+    workload.release()
+    assert workload.live_bytes == 0
+    assert workload.report()["long_lived_objects"] == 0
@@ -0,0 +1,140 @@
+import urllib.request
+from array import array
+import pytest
+from core.results import LatencyResult, SoakResult
+from core.sample_tags import SampleTags
+from core import test_executor
+from core.test_executor import PROGRESS_INTERVAL
+from core.timing import get_calibration
+from engines.simple_engine_driver import SimpleEngineDriver
+from plugins import openmetrics_exporter
+from plugins.openmetrics_exporter import OpenMetricsExporterPlugin
+from test_strategies.latency_strategy import LatencyStrategy
+
+
+@pytest.fixture
+def exporter():
+    plugin = OpenMetricsExporterPlugin(port=0)
+    yield plugin
+    plugin.close()
+
+
+def _latency_result(latencies_ns):
+    return LatencyResult(
+        engine_name="Alpha",
+        latencies_ns=array("q", latencies_ns),
+        timestamps_ns=array("q", range(len(latencies_ns))),
+        sample_tags=SampleTags.generate(len(latencies_ns), seed=0),
+        clock_calibration=get_calibration(),
+    )
+
+
+def _scrape(url, accept):
+    request = urllib.request.Request(url, headers={"Accept": accept})
+    with urllib.request.urlopen(request, timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode()
+
+
+def test_scrape_exposes_counters_and_histogram(exporter):
+    exporter.on_test_start("Alpha", "latency")
+    exporter.on_test_complete(_latency_result([20_000, 40_000, 2_000_000]))
+
+    content_type, body = _scrape(exporter.url, "application/openmetrics-text")
+    lines = body.splitlines()
+
+    assert content_type.startswith("application/openmetrics-text")
+    assert lines[-1] == "# EOF"
+    assert "# TYPE testpack_tests_completed counter" in lines
+    assert 'testpack_tests_completed_total{engine="Alpha",test_type="latency"} 1' in lines
+    assert 'testpack_tests_running{engine="Alpha",test_type="latency"} 0' in lines
+    assert 'testpack_samples_total{engine="Alpha",test_type="latency"} 3' in lines
+    assert 'testpack_latency_seconds_bucket{engine="Alpha",test_type="latency",le="2.5e-05"} 1' in lines
+    assert 'testpack_latency_seconds_bucket{engine="Alpha",test_type="latency",le="0.001"} 2' in lines
+    assert 'testpack_latency_seconds_bucket{engine="Alpha",test_type="latency",le="+Inf"} 3' in lines
+
+
+def test_prometheus_text_format_and_running_tests(exporter):
+    exporter.on_test_start("Beta", "stress")
+
+    content_type, body = _scrape(exporter.url, "text/plain")
+
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert "# TYPE testpack_tests_started_total counter" in body
+    assert 'testpack_tests_running{engine="Beta",test_type="stress"} 1' in body
+    assert "# EOF" not in body
+
+
+def test_resumed_soak_counts_only_this_runs_samples(exporter):
+    # The report covers 1000 operations, 600 of them from the interrupted run
+    resumed = SoakResult(
+        engine_name="Alpha", segment_dir="run-0000", resumed_segments=3, samples=400,
+        report={"summary": {"count": 1_000}},
+    )
+    exporter.on_test_start("Alpha", "soak")
+    exporter.on_test_complete(resumed)
+    assert 'testpack_samples_total{engine="Alpha",test_type="soak"} 400' in exporter.render()
+
+    # Progress reports already counted them; completion adds nothing
+    exporter.on_test_start("Alpha", "soak")
+    exporter.on_test_progress("Alpha", "soak", array("q", [1_000] * 400))
+    exporter.on_test_complete(resumed)
+    assert 'testpack_samples_total{engine="Alpha",test_type="soak"} 800' in exporter.render()
+
+
+def test_hooks_do_not_wait_for_scrapes(exporter):
+    # A scrape in progress holds the fold lock; the hooks must not need it
+    with exporter._fold_lock:
+        exporter.on_test_start("Alpha", "latency")
+        exporter.on_test_complete(_latency_result([1_000]))
+
+    assert 'testpack_tests_completed_total{engine="Alpha",test_type="latency"} 1' in exporter.render()
+
+
+class ScrapingDriver(SimpleEngineDriver):
+    """Driver that scrapes the exporter from inside the measurement loop."""
+
+    def __init__(self, exporter, scrape_at):
+        super().__init__(name="Alpha", engine_name="Alpha")
+        self.exporter, self.scrape_at = exporter, scrape_at
+        self.sent = 0
+        self.scrapes = []
+
+    def execute_trade(self, symbol, volume, order_type="limit"):
+        if self.sent == self.scrape_at:
+            self.scrapes.append(self.exporter.render())
+        self.sent += 1
+        return 30_000
+
+
+def test_progress_moves_metrics_during_a_test(exporter):
+    # Scrape just before the last order, after one progress report
+    driver = ScrapingDriver(exporter, scrape_at=PROGRESS_INTERVAL + 1)
+    test_executor.TestExecutor(LatencyStrategy(), plugins=[exporter]).execute_test(driver, iterations=PROGRESS_INTERVAL + 2)
+
+    during, = driver.scrapes
+    assert f'testpack_samples_total{{engine="Alpha",test_type="latency"}} {PROGRESS_INTERVAL}' in during
+    assert 'testpack_tests_running{engine="Alpha",test_type="latency"} 1' in during
+    # Completion only adds the samples the progress reports did not cover
+    after = exporter.render()
+    assert f'testpack_samples_total{{engine="Alpha",test_type="latency"}} {PROGRESS_INTERVAL + 2}' in after
+    assert f'testpack_latency_seconds_count{{engine="Alpha",test_type="latency"}} {PROGRESS_INTERVAL + 2}' in after
+    assert 'testpack_tests_completed_total{engine="Alpha",test_type="latency"} 1' in after
+
+
+def test_events_do_not_pile_up_without_scrapes(exporter):
+    for _ in range(100):
+        exporter.on_test_start("Alpha", "latency")
+        exporter.on_test_progress("Alpha", "latency", array("q", [1_000] * 10))
+        exporter.on_test_complete(_latency_result([1_000] * 12))
+
+    assert not exporter._events
+    assert 'testpack_latency_seconds_count{engine="Alpha",test_type="latency"} 1200' in exporter.render()
+
+
+def test_bucketing_without_numpy(monkeypatch):
+    latencies = array("q", [5, 10_000, 10_001, 2_000_000, 10**12])
+    vectorized = openmetrics_exporter._bucket(latencies)
+    monkeypatch.setattr(openmetrics_exporter, "np", None)
+
+    assert openmetrics_exporter._bucket(latencies) == vectorized
+    assert vectorized[0][:2] == [2, 1] and vectorized[0][-1] == 1
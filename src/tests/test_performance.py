@@ -2,7 +2,7 @@ import pytest
 from core.interfaces import ITestStrategy
 from core.test_executor import TestExecutor
 from core.engine_factory import FACTORY
-from typing import Dict, Any
+from core.results import ResultRecord
 from testplan.testing.result import Result
 
 # The test function uses the dynamic parameters from conftest.py
@@ -23,7 +23,7 @@ def test_engine_performance(
     test_executor.set_strategy(test_strategy)
     
     # 3. Execute the test
-    results: Dict[str, Any] = test_executor.execute_test(
+    results: ResultRecord = test_executor.execute_test(
         engine=engine_instance,
         iterations=1000  # Example parameter
     )
@@ -40,20 +40,20 @@ def test_engine_performance(
     # Example Assertion for a latency test
     if test_strategy.test_type == 'latency':
         # You would use a defined performance baseline here, not a magic number
-        assert results['avg_latency_ms'] < 0.5, \
-               f"Latency for {engine_name} ({test_strategy.test_type}) failed: {results['avg_latency_ms']}ms"
+        assert results.avg_latency_ms < 0.5, \
+               f"Latency for {engine_name} ({test_strategy.test_type}) failed: {results.avg_latency_ms}ms"
 
     # Example: Check for basic required keys in results
-    # assert 'iterations' in results
-    # assert results['engine'] == engine_name
+    # assert results.iterations == 1000
+    # assert results.engine_name == engine_name
 
     # Basic validation
     result.true(
-        'iterations' in results,
+        results.iterations is not None,
         description="Results should contain iteration count"
     )
     result.equal(
-        results.get('engine'), 
+        results.engine_name, 
         engine_name,
         description="Engine name should match"
     )
\ No newline at end of file
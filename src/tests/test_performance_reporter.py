@@ -0,0 +1,30 @@
+from performance_reporter import build_timeseries, lttb, percentile_bands, render_html
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    xs = list(range(10_000))
+    ys = [1.0] * 10_000
+    ys[4321] = 50.0
+
+    out_x, out_y = lttb(xs, ys, 100)
+
+    assert len(out_x) == 100
+    assert (out_x[0], out_x[-1]) == (0, 9_999)
+    assert 50.0 in out_y
+
+
+def test_percentile_bands_cover_all_samples():
+    xs = list(range(1_000))
+    bands = percentile_bands(xs, [float(x % 10) for x in xs], buckets=10)
+
+    assert sum(bands["count"]) == 1_000
+    assert bands["min"] == [0.0] * 10
+    assert bands["max"] == [9.0] * 10
+
+
+def test_report_size_independent_of_iterations():
+    small = build_timeseries(list(range(0, 20_000, 2)), [1_000] * 10_000)
+    large = build_timeseries(list(range(0, 200_000, 2)), [1_000] * 100_000)
+
+    assert len(large["points"]["t_ms"]) == len(small["points"]["t_ms"]) == 1000
+    assert len(render_html({"t": large})) < 2 * len(render_html({"t": small}))
@@ -0,0 +1,90 @@
+import threading
+import time
+import trading_testplan
+from core.profiler import PROFILE_ENV, SamplingProfiler, install_signal_handlers
+
+
+def _busy_wait(duration_s: float):
+    end = time.perf_counter() + duration_s
+    while time.perf_counter() < end:
+        pass
+
+
+def test_profiler_samples_measured_region():
+    with SamplingProfiler(interval_s=0.001) as profiler:
+        _busy_wait(0.2)
+
+    summary = profiler.summary()
+    assert summary["samples"] > 10
+    assert summary["overhead_ms"] < summary["wall_ms"]
+    assert any("_busy_wait" in frame for frame, _ in profiler.top_frames())
+
+
+def test_folded_format():
+    with SamplingProfiler(interval_s=0.001) as profiler:
+        _busy_wait(0.05)
+
+    for line in profiler.folded().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        assert stack.split(";")[-1]
+
+
+def test_profiles_a_worker_thread():
+    # Testplan runs testcases on worker threads; the main thread samples them
+    install_signal_handlers()
+    profilers = []
+
+    def worker():
+        with SamplingProfiler(interval_s=0.001) as profiler:
+            _busy_wait(0.2)
+        profilers.append(profiler)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    profiler, = profilers
+    assert profiler.disabled_reason is None
+    assert profiler.samples > 10
+    assert any("_busy_wait" in frame for frame, _ in profiler.top_frames())
+    assert all("worker" in ";".join(stack) for stack in profiler.stacks)
+
+
+def test_only_one_of_concurrent_profilers_samples():
+    install_signal_handlers()
+    barrier = threading.Barrier(8)
+    profilers = []
+
+    def worker():
+        barrier.wait()
+        with SamplingProfiler(interval_s=0.001) as profiler:
+            _busy_wait(0.05)
+        profilers.append(profiler)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(profilers) == 8
+    # Threads that entered after the first one finished may sample too, but never two at once
+    sampling = sorted((p for p in profilers if p.disabled_reason is None), key=lambda p: p._start_ns)
+    assert sampling
+    for earlier, later in zip(sampling, sampling[1:]):
+        assert earlier._start_ns + earlier.wall_ns <= later._start_ns
+
+
+def test_suites_install_signal_handlers_only_when_profiling(monkeypatch):
+    calls = []
+    monkeypatch.setattr(trading_testplan, "install_signal_handlers", lambda: calls.append(1))
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+
+    trading_testplan.PerformanceSuite("AlphaEngine", "latency")
+    trading_testplan.ComparisonSuite("AlphaEngine", "BetaEngine")
+    assert not calls
+
+    trading_testplan.PerformanceSuite("AlphaEngine", "latency", profile=True)
+    trading_testplan.ComparisonSuite("AlphaEngine", "BetaEngine", profile=True)
+    assert len(calls) == 2
@@ -0,0 +1,119 @@
+import importlib
+import os
+import sys
+import pytest
+import core.result_cache as result_cache
+from core.result_cache import ResultCache
+from core.results import LatencySummary
+
+
+class DummyEngine:
+    name = "DummyEngine"
+
+
+class DummyStrategy:
+    def __init__(self, block_size: int = 10):
+        self.block_size = block_size
+
+
+def test_key_is_stable_and_parameter_sensitive(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    key = cache.make_key(DummyEngine(), DummyStrategy(), iterations=100)
+
+    assert key == cache.make_key(DummyEngine(), DummyStrategy(), iterations=100)
+    assert key != cache.make_key(DummyEngine(), DummyStrategy(), iterations=200)
+    assert key != cache.make_key(DummyEngine(), DummyStrategy(block_size=20), iterations=100)
+
+
+def test_round_trip_and_bypass(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    cache.put("abc", {"latencies_ns": [1, 2, 3]})
+
+    assert cache.get("abc") == {"latencies_ns": [1, 2, 3]}
+    assert cache.get("missing") is None
+    assert ResultCache(cache_dir=str(tmp_path), bypass=True).get("abc") is None
+
+
+def test_lru_eviction(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path), max_entries=2)
+    cache.put("first", {"n": 1})
+    cache.put("second", {"n": 2})
+    # Make "first" the oldest entry, then touch it through a hit
+    os.utime(tmp_path / "first.tpr", ns=(0, 0))
+    os.utime(tmp_path / "second.tpr", ns=(1, 1))
+    cache.get("first")
+    cache.put("third", {"n": 3})
+
+    assert cache.get("second") is None
+    assert cache.get("first") == {"n": 1}
+    assert cache.get("third") == {"n": 3}
+
+
+def test_undecodable_entries_are_misses(tmp_path):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    cache.put("renamed", LatencySummary(data_points=1, min_ms=1.0, max_ms=1.0, avg_ms=1.0))
+    # A record type this version does not know (same length keeps the header valid)
+    path = tmp_path / "renamed.tpr"
+    path.write_bytes(path.read_bytes().replace(b'"LatencySummary"', b'"RetiredSummary"'))
+    (tmp_path / "garbage.tpr").write_bytes(b"TPR1\xff")
+
+    assert cache.get("renamed") is None
+    assert cache.get("garbage") is None
+
+
+def test_decoding_bugs_are_not_hidden_as_misses(tmp_path, monkeypatch):
+    cache = ResultCache(cache_dir=str(tmp_path))
+    cache.put("abc", {"n": 1})
+
+    def broken_loads(data):
+        raise TypeError("bug in the decoder")
+
+    monkeypatch.setattr(result_cache, "loads", broken_loads)
+    with pytest.raises(TypeError):
+        cache.get("abc")
+
+
+def test_legacy_json_entries_are_cleaned_up(tmp_path):
+    (tmp_path / "old.json").write_text('{"n": 1}')
+    cache = ResultCache(cache_dir=str(tmp_path))
+
+    assert cache.evict() == ["old"]
+    cache.put("new", {"n": 2})
+    (tmp_path / "older.json").write_text('{"n": 0}')
+    cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_key_changes_with_imported_project_module(tmp_path, monkeypatch):
+    (tmp_path / "cached_dep.py").write_text("FACTOR = 1\n")
+    (tmp_path / "cached_strategy.py").write_text(
+        "from cached_dep import FACTOR\n\nclass CachedStrategy:\n    pass\n"
+    )
+    monkeypatch.setattr(result_cache, "SRC_ROOT", tmp_path.resolve())
+    monkeypatch.syspath_prepend(str(tmp_path))
+    strategy_cls = importlib.import_module("cached_strategy").CachedStrategy
+    cache = ResultCache(cache_dir=str(tmp_path / "cache"))
+
+    key = cache.make_key(DummyEngine(), strategy_cls(), iterations=100)
+    (tmp_path / "cached_dep.py").write_text("FACTOR = 2\n")
+
+    assert key != cache.make_key(DummyEngine(), strategy_cls(), iterations=100)
+    sys.modules.pop("cached_strategy", None)
+    sys.modules.pop("cached_dep", None)
+
+
+def test_key_does_not_depend_on_checkout_location(tmp_path, monkeypatch):
+    keys = []
+    for checkout in ("first", "second"):
+        root = tmp_path / checkout
+        root.mkdir()
+        (root / "moved_dep.py").write_text("FACTOR = 1\n")
+        (root / "moved_strategy.py").write_text("import moved_dep\n\nclass MovedStrategy:\n    pass\n")
+        monkeypatch.setattr(result_cache, "SRC_ROOT", root.resolve())
+        monkeypatch.syspath_prepend(str(root))
+        strategy_cls = importlib.import_module("moved_strategy").MovedStrategy
+        keys.append(ResultCache(cache_dir=str(tmp_path / "cache")).make_key(DummyEngine(), strategy_cls()))
+        sys.modules.pop("moved_strategy", None)
+        sys.modules.pop("moved_dep", None)
+
+    assert keys[0] == keys[1]
@@ -0,0 +1,62 @@
+from array import array
+import pytest
+from core.results import LatencyResult, StressMeasurement, StressResult, dumps, loads
+from core.sample_tags import SampleTags
+from core.timing import get_calibration
+
+
+def test_latency_record_round_trip():
+    tags = SampleTags.generate(100, seed=3)
+    record = LatencyResult(
+        engine_name="Alpha",
+        latencies_ns=array("q", range(100, 200)),
+        timestamps_ns=array("q", range(100)),
+        sample_tags=tags,
+        clock_calibration=get_calibration(),
+    )
+
+    decoded = loads(dumps(record))
+
+    assert decoded == LatencyResult(**{**record.to_dict(), "sample_tags": decoded.sample_tags})
+    assert decoded.sample_tags.codes == tags.codes
+    assert decoded.sample_tags.categories == tags.categories
+    assert decoded.latencies_ns.typecode == "q"
+
+
+def test_nested_records_and_plain_data():
+    measurement = StressMeasurement(1.0, 3.0, 2.0, array("d", [1.0, 2.0, 3.0]))
+    record = StressResult(
+        engine_name="Alpha",
+        iterations=3,
+        cpu_stress_ms=measurement,
+        memory_stress_ms=measurement,
+        io_stress_ms=measurement,
+        memory_workload={"top_allocation_sites": [{"site": "x.py:1", "count_diff": 2}]},
+        clock_calibration=get_calibration(),
+    )
+
+    assert loads(dumps(record)) == record
+    assert loads(dumps({"handle": {"shm_name": "psm_1"}, "n": [1, 2]})) == {"handle": {"shm_name": "psm_1"}, "n": [1, 2]}
+
+
+def test_columns_are_stored_as_raw_bytes():
+    samples = array("q", range(10_000))
+
+    assert len(dumps(samples)) < samples.itemsize * len(samples) + 128
+
+
+def test_rejects_foreign_and_truncated_data():
+    with pytest.raises(ValueError):
+        loads(b'{"not": "a record"}')
+    with pytest.raises(ValueError):
+        loads(dumps(array("q", range(10)))[:-1])
+
+
+def test_rejects_unknown_record_types():
+    data = dumps(StressMeasurement(1.0, 3.0, 2.0, array("d", [1.0])))
+    # Same length keeps the header valid
+    renamed = data.replace(b'"StressMeasurement"', b'"RetiredMeasuremen"')
+    assert len(renamed) == len(data)
+
+    with pytest.raises(ValueError, match="Unknown record type: RetiredMeasuremen"):
+        loads(renamed)
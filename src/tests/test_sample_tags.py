@@ -0,0 +1,45 @@
+from array import array
+import pytest
+from core.sample_tags import SampleTags, frame_to_table, latency_breakdown
+
+# symbol, size, latency (ms) per sample
+SAMPLES = [("A", 1, 1), ("A", 10, 2), ("B", 1, 10), ("A", 1, 3), ("B", 10, 20), ("A", 10, 4)]
+
+
+def _tags() -> SampleTags:
+    return SampleTags(
+        {"symbol": ["A", "B"], "size": [1, 10]},
+        {
+            "symbol": array("B", [["A", "B"].index(symbol) for symbol, _, _ in SAMPLES]),
+            "size": array("B", [[1, 10].index(size) for _, size, _ in SAMPLES]),
+        },
+    )
+
+
+def test_breakdown_counts_and_percentiles_per_group():
+    frame = _tags().to_frame(array("q", [ms * 1_000_000 for _, _, ms in SAMPLES]))
+
+    tables = {dim: frame_to_table(table) for dim, table in latency_breakdown(frame, ["symbol", "size"]).items()}
+
+    header = ["samples", "avg_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms"]
+    # Linear interpolation: A = [1, 2, 3, 4] ms, B = [10, 20] ms
+    assert tables["symbol"][0] == ["symbol"] + header
+    assert tables["symbol"][1] == ["A", 4, 2.5, 2.5, pytest.approx(3.7), pytest.approx(3.97), 4.0]
+    assert tables["symbol"][2] == ["B", 2, 15.0, 15.0, pytest.approx(19.0), pytest.approx(19.9), 20.0]
+    # size 1 = [1, 3, 10] ms, size 10 = [2, 4, 20] ms
+    assert tables["size"][0] == ["size"] + header
+    assert tables["size"][1] == ["1", 3, pytest.approx(14 / 3), 3.0, pytest.approx(8.6), pytest.approx(9.86), 10.0]
+    assert tables["size"][2] == ["10", 3, pytest.approx(26 / 3), 4.0, pytest.approx(16.8), pytest.approx(19.68), 20.0]
+
+
+def test_dimensions_with_more_than_256_values():
+    symbols = [f"SYM{i}" for i in range(300)]
+    tags = SampleTags.generate(2_000, {"symbol": symbols, "side": ["buy", "sell"]}, seed=1)
+
+    assert tags.codes["symbol"].typecode == "H"
+    assert tags.codes["side"].typecode == "B"
+    assert max(tags.codes["symbol"]) >= 256
+
+    frame = tags.to_frame(array("q", range(2_000)))
+    assert frame["symbol"].cast(str).to_list() == tags.values("symbol")
+    assert latency_breakdown(frame, ["symbol"])["symbol"]["samples"].sum() == 2_000
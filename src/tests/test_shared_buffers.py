@@ -0,0 +1,111 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+from core import shared_buffers
+from core.shared_buffers import (
+    SharedSampleBuffer, contains_shared_handles, open_samples, release, release_all
+)
+from engines.simple_engine_driver import SimpleEngineDriver
+from test_strategies.latency_strategy import LatencyStrategy
+from test_strategies.memory_workload import MemoryWorkloadConfig
+from test_strategies.stress_strategy import StressStrategy
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a separate interpreter (like a Testplan pool worker): fills a buffer and exits
+WORKER_SCRIPT = """
+import json
+from core.shared_buffers import SharedSampleBuffer
+buffer = SharedSampleBuffer.create(3)
+samples = buffer.raw_view()
+samples[0], samples[1], samples[2] = 7, 8, 9
+del samples
+buffer.close()
+print(json.dumps(buffer.handle))
+"""
+
+TINY_WORKLOAD = MemoryWorkloadConfig(
+    small_objects=10, mixed_allocations=10, large_buffer_size=1024, large_buffers=1,
+    max_long_lived=10, traced_rounds=1,
+)
+
+
+def _exists(handle) -> bool:
+    return os.path.exists(f"/dev/shm/{handle['shm_name']}")
+
+
+@pytest.fixture(autouse=True)
+def no_leftover_buffers():
+    yield
+    release_all()
+
+
+def test_create_attach_view_release():
+    buffer = SharedSampleBuffer.create(4)
+    samples = buffer.raw_view()
+    for i in range(4):
+        samples[i] = i * 10
+    del samples
+    handle = buffer.handle
+    buffer.close()
+
+    with open_samples(handle) as view:
+        assert list(view) == [0, 10, 20, 30]
+        del view
+    assert contains_shared_handles({"raw": [handle]})
+
+    release(handle)
+
+    with pytest.raises(FileNotFoundError):
+        SharedSampleBuffer.attach(handle)
+    release(handle)  # Releasing twice is harmless
+
+
+def test_release_all_frees_what_this_process_created():
+    handles = [SharedSampleBuffer.create(8, "d").handle for _ in range(3)]
+    release(handles[0])
+
+    assert release_all() == 2
+    assert not any(_exists(handle) for handle in handles)
+    assert not shared_buffers._CREATED
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs POSIX shared memory")
+def test_stress_run_leaves_no_segments_behind():
+    strategy = StressStrategy(shared_memory=True, memory_workload=TINY_WORKLOAD)
+    result = strategy.execute_test(SimpleEngineDriver(name="driver_Alpha", engine_name="Alpha"), iterations=2)
+    handles = [result.cpu_stress_ms.raw_data_ms, result.memory_stress_ms.raw_data_ms, result.io_stress_ms.raw_data_ms]
+
+    assert all(_exists(handle) for handle in handles)  # Still readable after the test
+    release_all()
+    assert not any(_exists(handle) for handle in handles)
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs POSIX shared memory")
+def test_main_process_owns_buffers_created_by_workers():
+    worker = subprocess.run(
+        [sys.executable, "-c", WORKER_SCRIPT], capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": SRC_DIR},
+    )
+    handle = json.loads(worker.stdout.splitlines()[-1])
+
+    # The worker has exited; its samples are still readable here
+    with open_samples(handle) as view:
+        assert list(view) == [7, 8, 9]
+        del view
+    assert handle["shm_name"] not in shared_buffers._CREATED
+
+    assert release_all() == 1
+    assert not _exists(handle)
+
+
+def test_shared_memory_switch(monkeypatch):
+    monkeypatch.setenv(shared_buffers.SHARED_MEMORY_ENV, "1")
+    assert LatencyStrategy().shared_memory
+    assert StressStrategy().shared_memory
+    assert not LatencyStrategy(shared_memory=False).shared_memory
+
+    monkeypatch.delenv(shared_buffers.SHARED_MEMORY_ENV)
+    assert not StressStrategy().shared_memory
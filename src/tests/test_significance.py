@@ -0,0 +1,82 @@
+import random
+import pytest
+from core.significance import compare_distributions, compare_paired_blocks, mann_whitney_u, sign_flip_test
+
+
+def _samples(center: float, n: int = 400, seed: int = 1):
+    rng = random.Random(seed)
+    return [rng.gauss(center, 10.0) for _ in range(n)]
+
+
+def _blocks(pairs: int, block_size: int, shift: float = 0.0, seed: int = 1):
+    """Samples whose level drifts from block to block (as on a busy machine)."""
+    rng = random.Random(seed)
+    baseline, candidate = [], []
+    for _ in range(pairs):
+        baseline_level, candidate_level = rng.gauss(100.0, 10.0), rng.gauss(100.0 + shift, 10.0)
+        baseline += [baseline_level + rng.gauss(0.0, 1.0) for _ in range(block_size)]
+        candidate += [candidate_level + rng.gauss(0.0, 1.0) for _ in range(block_size)]
+    return baseline, candidate
+
+
+def test_identical_distributions_are_not_significant():
+    comparison = compare_distributions(_samples(100.0, seed=1), _samples(100.0, seed=2), seed=7)
+
+    assert not comparison["significant"]
+    assert comparison["ci_low"] <= 0 <= comparison["ci_high"]
+
+
+def test_shifted_distribution_is_detected():
+    comparison = compare_distributions(_samples(100.0, seed=1), _samples(90.0, seed=2), seed=7)
+
+    assert comparison["significant"]
+    assert comparison["verdict"] == "candidate faster"
+    assert comparison["ci_low"] < comparison["median_diff"] < comparison["ci_high"] < 0
+
+
+def test_mann_whitney_handles_ties():
+    u, p_value = mann_whitney_u([1, 1, 2, 2], [1, 1, 2, 2])
+
+    assert u == 8
+    assert p_value == 1.0
+
+
+def test_block_drift_is_not_mistaken_for_a_difference():
+    baseline, candidate = _blocks(pairs=10, block_size=100, seed=3)
+
+    # Treating the 1000 samples per engine as independent finds a "difference"...
+    assert compare_distributions(baseline, candidate, seed=7)["significant"]
+    # ...that 10 pairs of blocks don't support
+    comparison = compare_paired_blocks(baseline, candidate, block_size=100, seed=7)
+    assert comparison["pairs"] == 10
+    assert not comparison["significant"]
+    assert comparison["ci_low"] <= 0 <= comparison["ci_high"]
+
+
+def test_paired_blocks_detect_a_consistent_shift():
+    baseline, candidate = _blocks(pairs=30, block_size=20, shift=-15.0)
+
+    comparison = compare_paired_blocks(baseline, candidate, block_size=20, seed=7)
+
+    assert comparison["significant"]
+    assert comparison["verdict"] == "candidate faster"
+    assert comparison["ci_low"] < comparison["median_diff"] < comparison["ci_high"] < 0
+
+
+def test_paired_blocks_keep_a_partial_last_block():
+    comparison = compare_paired_blocks([1, 1, 1, 5, 5], [2, 2, 2, 7, 7], block_size=3, resamples=200)
+
+    assert comparison["pairs"] == 2
+    assert comparison["pair_median_diff"] == 1.5  # median of (2 - 1, 7 - 5)
+
+
+def test_paired_blocks_need_equal_sample_counts():
+    with pytest.raises(ValueError):
+        compare_paired_blocks([1, 2, 3], [1, 2], block_size=2)
+
+
+def test_sign_flip_test_enumerates_small_samples():
+    # Only "all +" and "all -" of the 8 sign patterns reach |1 + 2 + 3|
+    assert sign_flip_test([1, 2, 3]) == 0.25
+    assert sign_flip_test([1, -1]) == 1.0
+    assert sign_flip_test([]) == 1.0
@@ -0,0 +1,82 @@
+import random
+import time
+import pytest
+from core.histogram import LatencyHistogram, bucket_bounds, bucket_index
+from core.soak import SoakRecorder
+from engines.simple_engine_driver import SimpleEngineDriver
+from test_strategies.soak_strategy import SoakStrategy
+
+
+def test_histogram_precision_and_merge():
+    rng = random.Random(7)
+    values = [rng.randint(1_000, 10_000_000) for _ in range(20_000)]
+    first, second = LatencyHistogram(), LatencyHistogram()
+    first.record_many(values[:10_000])
+    second.record_many(values[10_000:])
+    first.merge(second)
+
+    values.sort()
+    assert first.count == len(values)
+    assert abs(first.percentile(99) - values[19_799]) / values[19_799] < 0.02
+    for value in values[:1_000]:
+        low, high = bucket_bounds(bucket_index(value))
+        assert low <= value < high
+
+
+def test_segments_resume_and_rollups(tmp_path):
+    recorder = SoakRecorder(str(tmp_path), segment_interval_s=1.0)
+    start = recorder._segment_start_ns
+    for i in range(30):
+        # Three segments' worth of samples, 100ms apart
+        recorder.record(start + i * 100_000_000, 1_000 + i)
+    recorder.flush(start + 3_000_000_000)
+
+    # An interrupted run leaves the segments behind; a new recorder resumes
+    resumed = SoakRecorder(str(tmp_path), segment_interval_s=1.0)
+    assert resumed.resumed_segments == 3
+    assert resumed.recorded_duration_ns == 3_000_000_000
+
+    report = SoakRecorder.build_report(str(tmp_path))
+    assert report["summary"]["count"] == 30
+    assert sum(row["count"] for row in report["daily"]) == 30
+    assert sum(row["count"] for row in report["hourly"]) == 30
+
+
+class InterruptingDriver(SimpleEngineDriver):
+    """Driver whose engine "crashes" once `fail_after_s` have passed."""
+
+    def __init__(self, fail_after_s=None):
+        super().__init__(name="Alpha", engine_name="Alpha")
+        self.fail_at = time.monotonic() + fail_after_s if fail_after_s is not None else None
+        self.trades = 0
+
+    def execute_trade(self, symbol, volume, order_type="limit"):
+        if self.fail_at is not None and time.monotonic() >= self.fail_at:
+            raise ConnectionError("engine went away")
+        self.trades += 1
+        return 1_000
+
+
+def test_soak_strategy_resumes_interrupted_runs_and_restarts_completed_ones(tmp_path):
+    strategy = SoakStrategy(duration_s=0.2, segment_interval_s=0.02, segment_dir=str(tmp_path))
+
+    with pytest.raises(ConnectionError):
+        strategy.execute_test(InterruptingDriver(fail_after_s=0.1), iterations=0)
+    interrupted_dir = SoakStrategy.run_dir(str(tmp_path / "Alpha"))
+    assert not SoakRecorder.is_complete(interrupted_dir)
+
+    # Resumes the interrupted run for the remaining duration only
+    resumed_driver = InterruptingDriver()
+    resumed = strategy.execute_test(resumed_driver, iterations=0)
+    assert resumed.segment_dir == interrupted_dir
+    assert resumed.resumed_segments > 0
+    assert 0.2 <= resumed.report["duration_s"] < 0.3
+    assert resumed.report["summary"]["count"] > resumed.samples == resumed_driver.trades
+    assert SoakRecorder.is_complete(interrupted_dir)
+
+    # A completed soak is not replayed: the next run starts fresh
+    fresh_driver = InterruptingDriver()
+    fresh = strategy.execute_test(fresh_driver, iterations=0)
+    assert fresh.segment_dir != resumed.segment_dir
+    assert fresh.resumed_segments == 0
+    assert fresh.report["summary"]["count"] == fresh.samples == fresh_driver.trades > 0
@@ -0,0 +1,38 @@
+import time
+from core.timing import CLOCKS, ClockCalibration, calibrate_clock, subtract_overhead
+
+
+def _calibration(read_overhead_ns: float) -> ClockCalibration:
+    return ClockCalibration(
+        clock="perf_counter", reported_resolution_ns=1.0, resolution_ns=1.0,
+        read_overhead_ns=read_overhead_ns, monotonic=True, samples=1,
+    )
+
+
+def test_calibrate_clock_measures_resolution_overhead_and_monotonicity():
+    calibration = calibrate_clock("perf_counter", samples=2_000)
+
+    assert calibration.clock == "perf_counter"
+    assert calibration.samples == 2_000
+    assert calibration.reported_resolution_ns == time.get_clock_info("perf_counter").resolution * 1_000_000_000
+    assert 0 < calibration.resolution_ns < 1_000_000
+    # The median read pair can't be cheaper than zero or than a single observed step
+    assert calibration.resolution_ns <= calibration.read_overhead_ns or calibration.read_overhead_ns == 0
+    assert 0 <= calibration.read_overhead_ns < 1_000_000
+    assert calibration.monotonic
+    assert calibration.to_dict()["clock"] == "perf_counter"
+
+
+def test_calibrate_clock_reports_a_clock_going_backwards(monkeypatch):
+    reads = iter([100, 90] * 10)
+    monkeypatch.setitem(CLOCKS, "perf_counter", lambda: next(reads))
+
+    calibration = calibrate_clock("perf_counter", samples=10)
+
+    assert not calibration.monotonic
+    assert calibration.read_overhead_ns == -10.0
+
+
+def test_subtract_overhead_clamps_at_zero():
+    assert subtract_overhead([1_000, 130, 129, 0, 131], _calibration(130.7)) == [870, 0, 0, 0, 1]
+    assert subtract_overhead([5, 6], _calibration(0.0)) == [5, 6]
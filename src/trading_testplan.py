@@ -1,3 +1,4 @@
+import contextlib
 import sys
 import traceback
 from rich import print as rprint
@@ -8,7 +9,14 @@ from testplan.testing.multitest.driver.base import Driver
 from testplan.testing.multitest.base import RuntimeEnvironment
 from testplan.testing.result import Result
 from core.engine_factory import FACTORY
-from core.interfaces import ITestStrategy
+from core.profiler import SamplingProfiler, install_signal_handlers, profiling_requested
+from core.result_cache import RESULT_CACHE
+from core.shared_buffers import release_all
+from core.timing import get_calibration
+from core.interfaces import IPlugin, ITestStrategy
+from core.test_executor import TestExecutor
+from plugins.openmetrics_exporter import get_exporter
+from typing import List
 
 # Test configuration map: Engine Name -> List of Test Types
 PERFORMANCE_TEST_MAP = {
@@ -16,17 +24,38 @@ PERFORMANCE_TEST_MAP = {
     "BetaEngine": ["latency", "stress"]
 }
 
+# Interleaved A/B comparisons: (Baseline Engine, Challenger Engine)
+COMPARISON_TEST_MAP = [
+    ("AlphaEngine", "BetaEngine")
+]
+
+# Run parameters (also part of the result cache key)
+ITERATIONS = 1000
+WARMUP_TRADES = 500
+
+def executor_plugins() -> List[IPlugin]:
+    """Plugins notified live while strategies run (the OpenMetrics exporter, if enabled)."""
+    exporter = get_exporter()
+    return [exporter] if exporter else []
+
 @testsuite
 class PerformanceSuite:
     """A suite of generic performance tests."""
 
-    def __init__(self, engine_name: str, test_type: str):
+    def __init__(self, engine_name: str, test_type: str, profile: bool = None):
         self.engine_name = engine_name
         self.test_type = test_type
+        # Opt-in sampling profiler around the measured region
+        self.profile = profiling_requested() if profile is None else profile
+        if self.profile:
+            # Timer signals of worker-thread testcases are handled on the main
+            # thread, where suites are built; left alone when not profiling
+            install_signal_handlers()
         try:
             rprint(f"[blue]Creating strategy for {test_type}[/blue]")
             self.strategy: ITestStrategy = FACTORY.create_strategy_instance(test_type)
             rprint(f"[green]Successfully created {test_type} strategy[/green]")
+            self.executor = TestExecutor(self.strategy, plugins=executor_plugins())
         except ValueError as e:
             rprint(f"[red]Error creating strategy instance: {str(e)}[/red]")
             raise
@@ -50,15 +79,30 @@ class PerformanceSuite:
             engine_driver: Driver = getattr(env, f"driver_{self.engine_name}")
             rprint(f"[blue]Using driver: {engine_driver}[/blue]")
 
-            # Pre-test setup (Command execution)
-            engine_driver.warmup(num_trades=500)
-            rprint(f"[green]Warmup complete for {test_name}[/green]")
-            
-            # Execute the test strategy (Command execution)
-            # 5000 is the number of iterations for the test
-            raw_results = self.strategy.execute_test(engine_driver, iterations=1000)
-            # rprint(f"Raw results: {raw_results}")
-            rprint(f"[blue]Got raw results for {test_name}[/blue]")
+            # Skip the measurement when neither the code nor the environment changed
+            cache_key = RESULT_CACHE.make_key(
+                engine_driver, self.strategy, iterations=ITERATIONS, warmup_trades=WARMUP_TRADES
+            )
+            raw_results = RESULT_CACHE.get(cache_key) if self.strategy.cacheable else None
+
+            if raw_results is None:
+                # Pre-test setup (Command execution)
+                engine_driver.warmup(num_trades=WARMUP_TRADES)
+                rprint(f"[green]Warmup complete for {test_name}[/green]")
+
+                # Execute the test strategy (Command execution)
+                profiler = SamplingProfiler() if self.profile else None
+                with profiler or contextlib.nullcontext():
+                    raw_results = self.executor.execute_test(engine_driver, iterations=ITERATIONS)
+                if profiler:
+                    profiler.attach_to(result, test_name)
+                if self.strategy.cacheable:
+                    RESULT_CACHE.put(cache_key, raw_results)
+                # rprint(f"Raw results: {raw_results}")
+                rprint(f"[blue]Got raw results for {test_name}[/blue]")
+            else:
+                result.log(f"Reusing cached results (key {cache_key[:12]})")
+                rprint(f"[yellow]Cache hit for {test_name}, skipping execution[/yellow]")
 
             rprint(f"Analyzing results for test: {test_name}") 
             # Analyze and report results
@@ -76,10 +120,76 @@ class PerformanceSuite:
             result.log(error_msg)
             result.fail(f"Test failed with error: {str(e)}")
 
+@testsuite
+class ComparisonSuite:
+    """Interleaved A/B comparison of two engines within a single test."""
+
+    def __init__(self, baseline_engine: str, challenger_engine: str, profile: bool = None):
+        self.baseline_engine = baseline_engine
+        self.challenger_engine = challenger_engine
+        self.profile = profiling_requested() if profile is None else profile
+        if self.profile:
+            install_signal_handlers()
+        self.strategy: ITestStrategy = FACTORY.create_strategy_instance("comparison")
+        self.executor = TestExecutor(self.strategy, plugins=executor_plugins())
+
+    @testcase()
+    def run_comparison_test(self, env: RuntimeEnvironment, result: Result):
+        """Alternates blocks of orders between both drivers and reports the difference."""
+        test_name = f"{self.baseline_engine}_vs_{self.challenger_engine}"
+        result.log(f"Running comparison: {test_name}")
+
+        try:
+            baseline_driver: Driver = getattr(env, f"driver_{self.baseline_engine}")
+            challenger_driver: Driver = getattr(env, f"driver_{self.challenger_engine}")
+
+            cache_key = RESULT_CACHE.make_key(
+                baseline_driver, self.strategy, challenger=challenger_driver.name,
+                iterations=ITERATIONS, warmup_trades=WARMUP_TRADES
+            )
+            raw_results = RESULT_CACHE.get(cache_key) if self.strategy.cacheable else None
+
+            if raw_results is None:
+                # Warm both engines before interleaving so neither starts cold
+                baseline_driver.warmup(num_trades=WARMUP_TRADES)
+                challenger_driver.warmup(num_trades=WARMUP_TRADES)
+                profiler = SamplingProfiler() if self.profile else None
+                with profiler or contextlib.nullcontext():
+                    raw_results = self.executor.execute_test(
+                        baseline_driver, iterations=ITERATIONS, challenger=challenger_driver
+                    )
+                if profiler:
+                    profiler.attach_to(result, test_name)
+                if self.strategy.cacheable:
+                    RESULT_CACHE.put(cache_key, raw_results)
+            else:
+                result.log(f"Reusing cached results (key {cache_key[:12]})")
+
+            comparison = self.strategy.analyze_results(raw_results, result)
+            rprint(f"[green]Comparison complete for {test_name}: {comparison['verdict']}[/green]")
+
+        except AttributeError as e:
+            error_msg = f"Driver not found: {str(e)}"
+            rprint(f"[red]{error_msg}[/red]")
+            result.log(error_msg)
+            result.fail("Test failed due to missing driver")
+        except Exception as e:
+            error_msg = f"Comparison execution failed: {str(e)}"
+            rprint(f"[red]{error_msg}[/red]")
+            result.log(error_msg)
+            result.fail(f"Test failed with error: {str(e)}")
+
 @test_plan(name="TradingEnginePerformancePlan", **FACTORY.get_plugins_config()) 
 def main(plan):
     """Main test plan entry point with error handling."""
     try:
+        # Calibrate the shared clock once, before any measurement
+        calibration = get_calibration()
+        rprint(
+            f"[blue]Clock {calibration.clock}: resolution {calibration.resolution_ns:.0f} ns, "
+            f"read overhead {calibration.read_overhead_ns:.0f} ns, monotonic {calibration.monotonic}[/blue]"
+        )
+
         # Track unique test names
         test_names = set()
 
@@ -113,9 +223,27 @@ def main(plan):
                     rprint(f"[red]Error setting up test {engine_name}_{test_type}: {str(e)}[/red]")
                     raise
 
+        for baseline_engine, challenger_engine in COMPARISON_TEST_MAP:
+            test_name = f"{baseline_engine}_vs_{challenger_engine}"
+            plan.add(
+                MultiTest(
+                    name=test_name,
+                    suites=[ComparisonSuite(baseline_engine, challenger_engine)],
+                    environment=[
+                        FACTORY.create_driver_config(baseline_engine),
+                        FACTORY.create_driver_config(challenger_engine)
+                    ]
+                )
+            )
+            rprint(f"[green]Added comparison: {test_name}[/green]")
+
         # Execute test plan once
         rprint("[blue]Executing test plan...[/blue]")
-        result = plan.run()
+        try:
+            result = plan.run()
+        finally:
+            # The plan owns the shared sample buffers; the report plugins are done with them
+            release_all()
         
         if not result:
             rprint("[red]Test plan execution failed![/red]")